@@ -4,6 +4,7 @@ Configuration for liikelaajuus
 """
 
 from pathlib import Path
+import json
 import sys
 from datetime import date
 
@@ -32,6 +33,11 @@ class Config(object):
     text_report_path = data_root_path / 'Raportit'
     excel_report_path = data_root_path / 'Raportit_Excel'
     tmpfile_path = tmp_path / 'liikelaajuus_tmp.json'
+    # delay (ms) from the last input change until tmpfile is written
+    tmpfile_save_delay = 500
+    # delay (ms) from the last input change until the database is updated
+    # (SQL version)
+    db_update_delay = 500
     json_backup_path = Path('Z:/Misc/ROM_backup')
     # prefix of default Excel report filename
     excel_report_prefix = 'Excel_'
@@ -40,8 +46,10 @@ class Config(object):
     # prefix of isokinetic text report filename
     isokin_text_report_prefix = 'Isokin_Raportti_'
     # exceptions that might be generated when parsing and loading/saving json
-    # these should all be caught
-    json_io_exceptions = (UnicodeDecodeError, EOFError, IOError, TypeError)
+    # these should all be caught (orjson reports decoding errors as
+    # JSONDecodeError instead of UnicodeDecodeError)
+    json_io_exceptions = (UnicodeDecodeError, json.JSONDecodeError, EOFError,
+                          IOError, TypeError)
     json_filter = 'JSON files (*.json)'
     text_filter = 'Text files (*.txt)'
     excel_filter = 'Excel files (*.xls)'
@@ -55,3 +63,5 @@ class Config(object):
     # allowing multiple instances is problematic since they share the same
     # backup file (tmpfile)
     allow_multiple_instances = False
+    # lock file held by a running instance
+    lockfile_path = tmp_path / 'liikelaajuus.lock'
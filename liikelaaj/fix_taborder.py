@@ -1,328 +1,337 @@
-self.setTabOrder(self.lnTiedotNimi, self.lnTiedotPvm)
-self.setTabOrder(self.lnTiedotPvm, self.lnTiedotDiag)
-self.setTabOrder(self.lnTiedotDiag, self.lnTiedotID)
-self.setTabOrder(self.lnTiedotID, self.lnTiedotHetu)
-self.setTabOrder(self.lnTiedotHetu, self.lnTiedotMittaajat)
-self.setTabOrder(self.lnTiedotMittaajat, self.cmtTiedot)
-self.setTabOrder(self.cmtTiedot, self.lnKyselyPaivittainenMatka)
-self.setTabOrder(self.lnKyselyPaivittainenMatka, self.cbKyselyPaivittainenYhtajaksMatkaApuv)
-self.setTabOrder(self.cbKyselyPaivittainenYhtajaksMatkaApuv, self.cbKyselyPaivittainenYhtajaksMatkaIlmanApuv)
-self.setTabOrder(self.cbKyselyPaivittainenYhtajaksMatkaIlmanApuv, self.cbFMSLyhyetMatkat)
-self.setTabOrder(self.cbFMSLyhyetMatkat, self.cbFMSKoulussa)
-self.setTabOrder(self.cbFMSKoulussa, self.cbFMSPitkatMatkat)
-self.setTabOrder(self.cbFMSPitkatMatkat, self.lnKyselyApuvRajoittavat)
-self.setTabOrder(self.lnKyselyApuvRajoittavat, self.lnKyselyApuvKaytossa)
-self.setTabOrder(self.lnKyselyApuvKaytossa, self.lnKyselyApuvMuutokset)
-self.setTabOrder(self.lnKyselyApuvMuutokset, self.xbKyselyFAQEiAskeleita)
-self.setTabOrder(self.xbKyselyFAQEiAskeleita, self.xbKyselyFAQAskellanTuettuna)
-self.setTabOrder(self.xbKyselyFAQAskellanTuettuna, self.xbKyselyFAQKavelenTerapiassa)
-self.setTabOrder(self.xbKyselyFAQKavelenTerapiassa, self.xbKyselyFAQKavelenLyhyitaMatkojaKotona)
-self.setTabOrder(self.xbKyselyFAQKavelenLyhyitaMatkojaKotona, self.xbKyselyFAQKavelenJonkinVerranSisalla)
-self.setTabOrder(self.xbKyselyFAQKavelenJonkinVerranSisalla, self.xbKyselyKavelenJonkinVerranUlkona)
-self.setTabOrder(self.xbKyselyKavelenJonkinVerranUlkona, self.xbKyselyFAQKavelenPitempiaMatkojaUlkonaTasaisella)
-self.setTabOrder(self.xbKyselyFAQKavelenPitempiaMatkojaUlkonaTasaisella, self.xbKyselyFAQKavelenPitempiaMatkojaUlkonaEpatasaisellaApua)
-self.setTabOrder(self.xbKyselyFAQKavelenPitempiaMatkojaUlkonaEpatasaisellaApua, self.xbKyselyFAQKavelenUlkonaEpatasaisellaPientaApua)
-self.setTabOrder(self.xbKyselyFAQKavelenUlkonaEpatasaisellaPientaApua, self.xbKyselyFAQKavelenUlkonaKaikissaMaastoissa)
-self.setTabOrder(self.xbKyselyFAQKavelenUlkonaKaikissaMaastoissa, self.lnKyselyFAQKOmmentit)
-self.setTabOrder(self.lnKyselyFAQKOmmentit, self.xbKyselyKipujaViim6kk)
-self.setTabOrder(self.xbKyselyKipujaViim6kk, self.lnKyselyKipuKuvaus)
-self.setTabOrder(self.lnKyselyKipuKuvaus, self.cmtKysely)
-self.setTabOrder(self.cmtKysely, self.spAntropAlaraajaOik)
-self.setTabOrder(self.spAntropAlaraajaOik, self.spAntropAlaraajaVas)
-self.setTabOrder(self.spAntropAlaraajaVas, self.spAntropPolviOik)
-self.setTabOrder(self.spAntropPolviOik, self.spAntropPolviVas)
-self.setTabOrder(self.spAntropPolviVas, self.spAntropNilkkaOik)
-self.setTabOrder(self.spAntropNilkkaOik, self.spAntropNilkkaVas)
-self.setTabOrder(self.spAntropNilkkaVas, self.spAntropJalkateraOik)
-self.setTabOrder(self.spAntropJalkateraOik, self.spAntropJalkateraVas)
-self.setTabOrder(self.spAntropJalkateraVas, self.spAntropSIAS)
-self.setTabOrder(self.spAntropSIAS, self.spAntropPituus)
-self.setTabOrder(self.spAntropPituus, self.spAntropPaino)
-self.setTabOrder(self.spAntropPaino, self.spAntropKenganNumeroOik)
-self.setTabOrder(self.spAntropKenganNumeroOik, self.spAntropKenganNumeroVas)
-self.setTabOrder(self.spAntropKenganNumeroVas, self.spAntropKenganPituusOik)
-self.setTabOrder(self.spAntropKenganPituusOik, self.spAntropKenganPituusVas)
-self.setTabOrder(self.spAntropKenganPituusVas, self.cmtAntrop)
-self.setTabOrder(self.cmtAntrop, self.csbLonkkaFleksioOik.focusProxy())
-self.setTabOrder(self.csbLonkkaFleksioOik.focusProxy(), self.csbLonkkaFleksioVas.focusProxy())
-self.setTabOrder(self.csbLonkkaFleksioVas.focusProxy(), self.csbLonkkaEkstensioVapOik.focusProxy())
-self.setTabOrder(self.csbLonkkaEkstensioVapOik.focusProxy(), self.csbLonkkaEkstensioVapVas.focusProxy())
-self.setTabOrder(self.csbLonkkaEkstensioVapVas.focusProxy(), self.csbLonkkaEkstensioAvOik.focusProxy())
-self.setTabOrder(self.csbLonkkaEkstensioAvOik.focusProxy(), self.csbLonkkaEkstensioAvVas.focusProxy())
-self.setTabOrder(self.csbLonkkaEkstensioAvVas.focusProxy(), self.csbLonkkaEkstensioPolvi90Oik.focusProxy())
-self.setTabOrder(self.csbLonkkaEkstensioPolvi90Oik.focusProxy(), self.csbLonkkaEkstensioPolvi90Vas.focusProxy())
-self.setTabOrder(self.csbLonkkaEkstensioPolvi90Vas.focusProxy(), self.csbLonkkaExtLagOik.focusProxy())
-self.setTabOrder(self.csbLonkkaExtLagOik.focusProxy(), self.csbLonkkaExtLagVas.focusProxy())
-self.setTabOrder(self.csbLonkkaExtLagVas.focusProxy(), self.csbLonkkaAbduktioLonkka0Polvi90Oik.focusProxy())
-self.setTabOrder(self.csbLonkkaAbduktioLonkka0Polvi90Oik.focusProxy(), self.csbLonkkaAbduktioLonkka0Polvi90Vas.focusProxy())
-self.setTabOrder(self.csbLonkkaAbduktioLonkka0Polvi90Vas.focusProxy(), self.csbLonkkaAdduktoritCatchOik.focusProxy())
-self.setTabOrder(self.csbLonkkaAdduktoritCatchOik.focusProxy(), self.csbLonkkaAdduktoritCatchVas.focusProxy())
-self.setTabOrder(self.csbLonkkaAdduktoritCatchVas.focusProxy(), self.csbLonkkaAbduktioLonkka0Oik.focusProxy())
-self.setTabOrder(self.csbLonkkaAbduktioLonkka0Oik.focusProxy(), self.csbLonkkaAbduktioLonkka0Vas.focusProxy())
-self.setTabOrder(self.csbLonkkaAbduktioLonkka0Vas.focusProxy(), self.csbLonkkaAbduktioLonkkaFleksOik.focusProxy())
-self.setTabOrder(self.csbLonkkaAbduktioLonkkaFleksOik.focusProxy(), self.csbLonkkaAbduktioLonkkaFleksVas.focusProxy())
-self.setTabOrder(self.csbLonkkaAbduktioLonkkaFleksVas.focusProxy(), self.csbLonkkaAdduktioOik.focusProxy())
-self.setTabOrder(self.csbLonkkaAdduktioOik.focusProxy(), self.csbLonkkaAdduktioVas.focusProxy())
-self.setTabOrder(self.csbLonkkaAdduktioVas.focusProxy(), self.lnLonkkaOberOik)
-self.setTabOrder(self.lnLonkkaOberOik, self.lnLonkkaOberVas)
-self.setTabOrder(self.lnLonkkaOberVas, self.csbLonkkaSisakiertoOik.focusProxy())
-self.setTabOrder(self.csbLonkkaSisakiertoOik.focusProxy(), self.csbLonkkaSisakiertoVas.focusProxy())
-self.setTabOrder(self.csbLonkkaSisakiertoVas.focusProxy(), self.csbLonkkaUlkokiertoOik.focusProxy())
-self.setTabOrder(self.csbLonkkaUlkokiertoOik.focusProxy(), self.csbLonkkaUlkokiertoVas.focusProxy())
-self.setTabOrder(self.csbLonkkaUlkokiertoVas.focusProxy(), self.cmtLonkkaPROM)
-self.setTabOrder(self.cmtLonkkaPROM, self.cmtLonkkaMuut)
-self.setTabOrder(self.cmtLonkkaMuut, self.cbLonkkaFleksioModAOik)
-self.setTabOrder(self.cbLonkkaFleksioModAOik, self.cbLonkkaFleksioModAVas)
-self.setTabOrder(self.cbLonkkaFleksioModAVas, self.cbLonkkaEkstensioModAOik)
-self.setTabOrder(self.cbLonkkaEkstensioModAOik, self.cbLonkkaEkstensioModAVas)
-self.setTabOrder(self.cbLonkkaEkstensioModAVas, self.cbLonkkaAdduktoritModAOik)
-self.setTabOrder(self.cbLonkkaAdduktoritModAOik, self.cbLonkkaAdduktoritModAVas)
-self.setTabOrder(self.cbLonkkaAdduktoritModAVas, self.cbLonkkaSisakiertoModAOik)
-self.setTabOrder(self.cbLonkkaSisakiertoModAOik, self.cbLonkkaSisakiertoModAVas)
-self.setTabOrder(self.cbLonkkaSisakiertoModAVas, self.cbLonkkaUlkokiertoModAOik)
-self.setTabOrder(self.cbLonkkaUlkokiertoModAOik, self.cbLonkkaUlkokiertoModAVas)
-self.setTabOrder(self.cbLonkkaUlkokiertoModAVas, self.cmtLonkkaSpast)
-self.setTabOrder(self.cmtLonkkaSpast, self.csbPolviEkstensioVapOik.focusProxy())
-self.setTabOrder(self.csbPolviEkstensioVapOik.focusProxy(), self.csbPolviEkstensioVapVas.focusProxy())
-self.setTabOrder(self.csbPolviEkstensioVapVas.focusProxy(), self.csbPolviEkstensioAvOik.focusProxy())
-self.setTabOrder(self.csbPolviEkstensioAvOik.focusProxy(), self.csbPolviEkstensioAvVas.focusProxy())
-self.setTabOrder(self.csbPolviEkstensioAvVas.focusProxy(), self.csbPolviFleksioSelinmakuuOik.focusProxy())
-self.setTabOrder(self.csbPolviFleksioSelinmakuuOik.focusProxy(), self.csbPolviFleksioSelinmakuuVas.focusProxy())
-self.setTabOrder(self.csbPolviFleksioSelinmakuuVas.focusProxy(), self.csbPolviFleksioVatsamakuuOik.focusProxy())
-self.setTabOrder(self.csbPolviFleksioVatsamakuuOik.focusProxy(), self.csbPolviFleksioVatsamakuuVas.focusProxy())
-self.setTabOrder(self.csbPolviFleksioVatsamakuuVas.focusProxy(), self.csbPolviRectusCatchOik.focusProxy())
-self.setTabOrder(self.csbPolviRectusCatchOik.focusProxy(), self.csbPolviRectusCatchVas.focusProxy())
-self.setTabOrder(self.csbPolviRectusCatchVas.focusProxy(), self.csbPolviHamstringCatchOik.focusProxy())
-self.setTabOrder(self.csbPolviHamstringCatchOik.focusProxy(), self.csbPolviHamstringCatchVas.focusProxy())
-self.setTabOrder(self.csbPolviHamstringCatchVas.focusProxy(), self.csbPolviPopliteaVastakkLonkka0Oik.focusProxy())
-self.setTabOrder(self.csbPolviPopliteaVastakkLonkka0Oik.focusProxy(), self.csbPolviPopliteaVastakkLonkka0Vas.focusProxy())
-self.setTabOrder(self.csbPolviPopliteaVastakkLonkka0Vas.focusProxy(), self.csbPolviPopliteaVastakkLonkka90Oik.focusProxy())
-self.setTabOrder(self.csbPolviPopliteaVastakkLonkka90Oik.focusProxy(), self.csbPolviPopliteaVastakkLonkka90Vas.focusProxy())
-self.setTabOrder(self.csbPolviPopliteaVastakkLonkka90Vas.focusProxy(), self.cmtPolviPROM)
-self.setTabOrder(self.cmtPolviPROM, self.cmtPolviSpast)
-self.setTabOrder(self.cmtPolviSpast, self.cbPolviRectusModAOik)
-self.setTabOrder(self.cbPolviRectusModAOik, self.cbPolviRectusModAVas)
-self.setTabOrder(self.cbPolviRectusModAVas, self.cbPolviHamstringModAOik)
-self.setTabOrder(self.cbPolviHamstringModAOik, self.cbPolviHamstringModAVas)
-self.setTabOrder(self.cbPolviHamstringModAVas, self.csbNilkkaSoleusCatchOik.focusProxy())
-self.setTabOrder(self.csbNilkkaSoleusCatchOik.focusProxy(), self.xbNilkkaSoleusKlonusOik)
-self.setTabOrder(self.xbNilkkaSoleusKlonusOik, self.csbNilkkaDorsifPolvi90PROMOik.focusProxy())
-self.setTabOrder(self.csbNilkkaDorsifPolvi90PROMOik.focusProxy(), self.xbNilkkaDorsifPolvi90AROMEversioOik)
-self.setTabOrder(self.xbNilkkaDorsifPolvi90AROMEversioOik, self.csbNilkkaDorsifPolvi90AROMOik.focusProxy())
-self.setTabOrder(self.csbNilkkaDorsifPolvi90AROMOik.focusProxy(), self.xbNilkkaGastroKlonusOik)
-self.setTabOrder(self.xbNilkkaGastroKlonusOik, self.csbNilkkaGastroCatchOik.focusProxy())
-self.setTabOrder(self.csbNilkkaGastroCatchOik.focusProxy(), self.csbNilkkaDorsifPolvi0PROMOik.focusProxy())
-self.setTabOrder(self.csbNilkkaDorsifPolvi0PROMOik.focusProxy(), self.csbNilkkaDorsifPolvi0AROMOik.focusProxy())
-self.setTabOrder(self.csbNilkkaDorsifPolvi0AROMOik.focusProxy(), self.xbNilkkaDorsifPolvi0AROMEversioOik)
-self.setTabOrder(self.xbNilkkaDorsifPolvi0AROMEversioOik, self.csbNilkkaPlantaarifleksioPROMOik.focusProxy())
-self.setTabOrder(self.csbNilkkaPlantaarifleksioPROMOik.focusProxy(), self.csbNilkkaPlantaarifleksioAROMOik.focusProxy())
-self.setTabOrder(self.csbNilkkaPlantaarifleksioAROMOik.focusProxy(), self.lnNilkkaConfusionOik)
-self.setTabOrder(self.lnNilkkaConfusionOik, self.csbNilkkaSoleusCatchVas.focusProxy())
-self.setTabOrder(self.csbNilkkaSoleusCatchVas.focusProxy(), self.xbNilkkaSoleusKlonusVas)
-self.setTabOrder(self.xbNilkkaSoleusKlonusVas, self.csbNilkkaDorsifPolvi90PROMVas.focusProxy())
-self.setTabOrder(self.csbNilkkaDorsifPolvi90PROMVas.focusProxy(), self.csbNilkkaDorsifPolvi90AROMVas.focusProxy())
-self.setTabOrder(self.csbNilkkaDorsifPolvi90AROMVas.focusProxy(), self.xbNilkkaDorsifPolvi90AROMEversioVas)
-self.setTabOrder(self.xbNilkkaDorsifPolvi90AROMEversioVas, self.csbNilkkaGastroCatchVas.focusProxy())
-self.setTabOrder(self.csbNilkkaGastroCatchVas.focusProxy(), self.xbNilkkaGastroKlonusVas)
-self.setTabOrder(self.xbNilkkaGastroKlonusVas, self.csbNilkkaDorsifPolvi0PROMVas.focusProxy())
-self.setTabOrder(self.csbNilkkaDorsifPolvi0PROMVas.focusProxy(), self.csbNilkkaDorsifPolvi0AROMVas.focusProxy())
-self.setTabOrder(self.csbNilkkaDorsifPolvi0AROMVas.focusProxy(), self.xbNilkkaDorsifPolvi0AROMEversioVas)
-self.setTabOrder(self.xbNilkkaDorsifPolvi0AROMEversioVas, self.csbNilkkaPlantaarifleksioPROMVas.focusProxy())
-self.setTabOrder(self.csbNilkkaPlantaarifleksioPROMVas.focusProxy(), self.csbNilkkaPlantaarifleksioAROMVas.focusProxy())
-self.setTabOrder(self.csbNilkkaPlantaarifleksioAROMVas.focusProxy(), self.lnNilkkaConfusionVas)
-self.setTabOrder(self.lnNilkkaConfusionVas, self.cmtNilkkaPROM)
-self.setTabOrder(self.cmtNilkkaPROM, self.cmtNilkkaAROM)
-self.setTabOrder(self.cmtNilkkaAROM, self.cmtNilkkaSpast)
-self.setTabOrder(self.cmtNilkkaSpast, self.cbNilkkaSoleusModAOik)
-self.setTabOrder(self.cbNilkkaSoleusModAOik, self.cbNilkkaSoleusModAVas)
-self.setTabOrder(self.cbNilkkaSoleusModAVas, self.cbNilkkaGastroModAOik)
-self.setTabOrder(self.cbNilkkaGastroModAOik, self.cbNilkkaGastroModAVas)
-self.setTabOrder(self.cbNilkkaGastroModAVas, self.cbJalkatSubtalarOik)
-self.setTabOrder(self.cbJalkatSubtalarOik, self.cbJalkatSubtalarVas)
-self.setTabOrder(self.cbJalkatSubtalarVas, self.cbJalkatTakaosanAsentoOik)
-self.setTabOrder(self.cbJalkatTakaosanAsentoOik, self.cbJalkatTakaosanAsentoVas)
-self.setTabOrder(self.cbJalkatTakaosanAsentoVas, self.cbJalkatTakaosanLiikeEversioOik)
-self.setTabOrder(self.cbJalkatTakaosanLiikeEversioOik, self.cbJalkatTakaosanLiikeEversioVas)
-self.setTabOrder(self.cbJalkatTakaosanLiikeEversioVas, self.cbJalkatTakaosanLiikeInversioOik)
-self.setTabOrder(self.cbJalkatTakaosanLiikeInversioOik, self.cbJalkatTakaosanLiikeInversioVas)
-self.setTabOrder(self.cbJalkatTakaosanLiikeInversioVas, self.cbJalkatHolvikaariOik)
-self.setTabOrder(self.cbJalkatHolvikaariOik, self.cbJalkatHolvikaariVas)
-self.setTabOrder(self.cbJalkatHolvikaariVas, self.cbJalkatKeskiosanliikeOik)
-self.setTabOrder(self.cbJalkatKeskiosanliikeOik, self.cbJalkatKeskiosanliikeVas)
-self.setTabOrder(self.cbJalkatKeskiosanliikeVas, self.cbJalkatEtuosanAsento1Oik)
-self.setTabOrder(self.cbJalkatEtuosanAsento1Oik, self.cbJalkatEtuosanAsento1Vas)
-self.setTabOrder(self.cbJalkatEtuosanAsento1Vas, self.cbJalkatEtuosanAsento2Oik)
-self.setTabOrder(self.cbJalkatEtuosanAsento2Oik, self.cbJalkatEtuosanAsento2Vas)
-self.setTabOrder(self.cbJalkatEtuosanAsento2Vas, self.cbJalkat1sadeOik)
-self.setTabOrder(self.cbJalkat1sadeOik, self.cbJalkat1sadeVas)
-self.setTabOrder(self.cbJalkat1sadeVas, self.csbJalkat1MTPojennusOik.focusProxy())
-self.setTabOrder(self.csbJalkat1MTPojennusOik.focusProxy(), self.csbJalkat1MTPojennusVas.focusProxy())
-self.setTabOrder(self.csbJalkat1MTPojennusVas.focusProxy(), self.cbJalkatVaivaisenluuOik)
-self.setTabOrder(self.cbJalkatVaivaisenluuOik, self.cbJalkatVaivaisenluuVas)
-self.setTabOrder(self.cbJalkatVaivaisenluuVas, self.lnJalkatKovettumatOik)
-self.setTabOrder(self.lnJalkatKovettumatOik, self.lnJalkatKovettumatVas)
-self.setTabOrder(self.lnJalkatKovettumatVas, self.cmtJalkateraKuormittamattomana)
-self.setTabOrder(self.cmtJalkateraKuormittamattomana, self.cmtJalkateraKuormitettuna)
-self.setTabOrder(self.cmtJalkateraKuormitettuna, self.cbJalkatTakaosanAsentoKuormOik)
-self.setTabOrder(self.cbJalkatTakaosanAsentoKuormOik, self.cbJalkatTakaosanAsentoKuormVas)
-self.setTabOrder(self.cbJalkatTakaosanAsentoKuormVas, self.cbJalkatTakaosanKiertoKuormOik)
-self.setTabOrder(self.cbJalkatTakaosanKiertoKuormOik, self.cbJalkatTakaosanKiertoKuormVas)
-self.setTabOrder(self.cbJalkatTakaosanKiertoKuormVas, self.cbJalkatKeskiosanAsentoKuormOik)
-self.setTabOrder(self.cbJalkatKeskiosanAsentoKuormOik, self.cbJalkatKeskiosanAsentoKuormVas)
-self.setTabOrder(self.cbJalkatKeskiosanAsentoKuormVas, self.cbJalkatEtuosanAsento1KuormOik)
-self.setTabOrder(self.cbJalkatEtuosanAsento1KuormOik, self.cbJalkatEtuosanAsento1KuormVas)
-self.setTabOrder(self.cbJalkatEtuosanAsento1KuormVas, self.cbJalkatEtuosanAsento2KuormOik)
-self.setTabOrder(self.cbJalkatEtuosanAsento2KuormOik, self.cbJalkatEtuosanAsento2KuormVas)
-self.setTabOrder(self.cbJalkatEtuosanAsento2KuormVas, self.cbJalkatFeissinLinjaOik)
-self.setTabOrder(self.cbJalkatFeissinLinjaOik, self.cbJalkatFeissinLinjaVas)
-self.setTabOrder(self.cbJalkatFeissinLinjaVas, self.spJalkatNavDropIstuenOik)
-self.setTabOrder(self.spJalkatNavDropIstuenOik, self.spJalkatNavDropIstuenVas)
-self.setTabOrder(self.spJalkatNavDropIstuenVas, self.spJalkatNavDropSeistenOik)
-self.setTabOrder(self.spJalkatNavDropSeistenOik, self.spJalkatNavDropSeistenVas)
-self.setTabOrder(self.spJalkatNavDropSeistenVas, self.lnJalkatColemanOik)
-self.setTabOrder(self.lnJalkatColemanOik, self.lnJalkatColemanVas)
-self.setTabOrder(self.lnJalkatColemanVas, self.xbPainelevy)
-self.setTabOrder(self.xbPainelevy, self.lnJalkatPainelevyTiedot)
-self.setTabOrder(self.lnJalkatPainelevyTiedot, self.cbVoimaLonkkaEkstensioPolvi0Oik)
-self.setTabOrder(self.cbVoimaLonkkaEkstensioPolvi0Oik, self.cbVoimaLonkkaEkstensioPolvi0Vas)
-self.setTabOrder(self.cbVoimaLonkkaEkstensioPolvi0Vas, self.cbVoimaLonkkaEkstensioPolvi90Oik)
-self.setTabOrder(self.cbVoimaLonkkaEkstensioPolvi90Oik, self.cbVoimaLonkkaEkstensioPolvi90Vas)
-self.setTabOrder(self.cbVoimaLonkkaEkstensioPolvi90Vas, self.cbVoimaPolviFleksioOik)
-self.setTabOrder(self.cbVoimaPolviFleksioOik, self.cbVoimaPolviFleksioVas)
-self.setTabOrder(self.cbVoimaPolviFleksioVas, self.cbVoimaLonkkaAbduktioLonkka0Oik)
-self.setTabOrder(self.cbVoimaLonkkaAbduktioLonkka0Oik, self.cbVoimaLonkkaAbduktioLonkka0Vas)
-self.setTabOrder(self.cbVoimaLonkkaAbduktioLonkka0Vas, self.cbVoimaLonkkaAbduktioLonkkaFleksOik)
-self.setTabOrder(self.cbVoimaLonkkaAbduktioLonkkaFleksOik, self.cbVoimaLonkkaAbduktioLonkkaFleksVas)
-self.setTabOrder(self.cbVoimaLonkkaAbduktioLonkkaFleksVas, self.cbVoimaLonkkaAdduktioOik)
-self.setTabOrder(self.cbVoimaLonkkaAdduktioOik, self.cbVoimaLonkkaAdduktioVas)
-self.setTabOrder(self.cbVoimaLonkkaAdduktioVas, self.cbVoimaSelka)
-self.setTabOrder(self.cbVoimaSelka, self.cbVoimaVatsaSuorat)
-self.setTabOrder(self.cbVoimaVatsaSuorat, self.cbVoimaVatsaVinotOik)
-self.setTabOrder(self.cbVoimaVatsaVinotOik, self.cbVoimaVatsaVinotVas)
-self.setTabOrder(self.cbVoimaVatsaVinotVas, self.cbVoimaLonkkaFleksioOik)
-self.setTabOrder(self.cbVoimaLonkkaFleksioOik, self.cbVoimaLonkkaFleksioVas)
-self.setTabOrder(self.cbVoimaLonkkaFleksioVas, self.cbVoimaPolviEkstensioOik)
-self.setTabOrder(self.cbVoimaPolviEkstensioOik, self.cbVoimaPolviEkstensioVas)
-self.setTabOrder(self.cbVoimaPolviEkstensioVas, self.cbVoimaLonkkaUlkokiertoOik)
-self.setTabOrder(self.cbVoimaLonkkaUlkokiertoOik, self.cbVoimaLonkkaUlkokiertoVas)
-self.setTabOrder(self.cbVoimaLonkkaUlkokiertoVas, self.cbVoimaLonkkaSisakiertoOik)
-self.setTabOrder(self.cbVoimaLonkkaSisakiertoOik, self.cbVoimaLonkkaSisakiertoVas)
-self.setTabOrder(self.cbVoimaLonkkaSisakiertoVas, self.cmtVoima1)
-self.setTabOrder(self.cmtVoima1, self.cbSelLonkkaEkstensioPolvi0Oik)
-self.setTabOrder(self.cbSelLonkkaEkstensioPolvi0Oik, self.cbSelLonkkaEkstensioPolvi0Vas)
-self.setTabOrder(self.cbSelLonkkaEkstensioPolvi0Vas, self.cbSelLonkkaEkstensioPolvi90Oik)
-self.setTabOrder(self.cbSelLonkkaEkstensioPolvi90Oik, self.cbSelLonkkaEkstensioPolvi90Vas)
-self.setTabOrder(self.cbSelLonkkaEkstensioPolvi90Vas, self.cbSelPolviFleksioOik)
-self.setTabOrder(self.cbSelPolviFleksioOik, self.cbSelPolviFleksioVas)
-self.setTabOrder(self.cbSelPolviFleksioVas, self.cbSelLonkkaAbduktioLonkka0Oik)
-self.setTabOrder(self.cbSelLonkkaAbduktioLonkka0Oik, self.cbSelLonkkaAbduktioLonkka0Vas)
-self.setTabOrder(self.cbSelLonkkaAbduktioLonkka0Vas, self.cbSelLonkkaAdduktioOik)
-self.setTabOrder(self.cbSelLonkkaAdduktioOik, self.cbSelLonkkaAdduktioVas)
-self.setTabOrder(self.cbSelLonkkaAdduktioVas, self.cbSelLonkkaFleksioOik)
-self.setTabOrder(self.cbSelLonkkaFleksioOik, self.cbSelLonkkaFleksioVas)
-self.setTabOrder(self.cbSelLonkkaFleksioVas, self.cbSelPolviEkstensioOik)
-self.setTabOrder(self.cbSelPolviEkstensioOik, self.cbSelPolviEkstensioVas)
-self.setTabOrder(self.cbSelPolviEkstensioVas, self.cbSelLonkkaUlkokiertoOik)
-self.setTabOrder(self.cbSelLonkkaUlkokiertoOik, self.cbSelLonkkaUlkokiertoVas)
-self.setTabOrder(self.cbSelLonkkaUlkokiertoVas, self.cbSelLonkkaSisakiertoOik)
-self.setTabOrder(self.cbSelLonkkaSisakiertoOik, self.cbSelLonkkaSisakiertoVas)
-self.setTabOrder(self.cbSelLonkkaSisakiertoVas, self.cbVoimaTibialisAnteriorOik)
-self.setTabOrder(self.cbVoimaTibialisAnteriorOik, self.cbVoimaTibialisAnteriorVas)
-self.setTabOrder(self.cbVoimaTibialisAnteriorVas, self.cbVoimaTibialisPosteriorOik)
-self.setTabOrder(self.cbVoimaTibialisPosteriorOik, self.cbVoimaTibialisPosteriorVas)
-self.setTabOrder(self.cbVoimaTibialisPosteriorVas, self.cbVoimaPeroneusOik)
-self.setTabOrder(self.cbVoimaPeroneusOik, self.cbVoimaPeroneusVas)
-self.setTabOrder(self.cbVoimaPeroneusVas, self.cbVoimaExtHallucisLongusOik)
-self.setTabOrder(self.cbVoimaExtHallucisLongusOik, self.cbVoimaExtHallucisLongusVas)
-self.setTabOrder(self.cbVoimaExtHallucisLongusVas, self.cbVoimaFlexHallucisLongusOik)
-self.setTabOrder(self.cbVoimaFlexHallucisLongusOik, self.cbVoimaFlexHallucisLongusVas)
-self.setTabOrder(self.cbVoimaFlexHallucisLongusVas, self.cbVoima25OjennusOik)
-self.setTabOrder(self.cbVoima25OjennusOik, self.cbVoima25OjennusVas)
-self.setTabOrder(self.cbVoima25OjennusVas, self.cbVoima25KoukistusOik)
-self.setTabOrder(self.cbVoima25KoukistusOik, self.cbVoima25KoukistusVas)
-self.setTabOrder(self.cbVoima25KoukistusVas, self.cbVoimaGastroOik)
-self.setTabOrder(self.cbVoimaGastroOik, self.cbVoimaGastroVas)
-self.setTabOrder(self.cbVoimaGastroVas, self.cbVoimaSoleusOik)
-self.setTabOrder(self.cbVoimaSoleusOik, self.cbVoimaSoleusVas)
-self.setTabOrder(self.cbVoimaSoleusVas, self.cmtVoima2)
-self.setTabOrder(self.cmtVoima2, self.cbSelTibialisAnteriorOik)
-self.setTabOrder(self.cbSelTibialisAnteriorOik, self.cbSelTibialisAnteriorVas)
-self.setTabOrder(self.cbSelTibialisAnteriorVas, self.cbSelTibialisPosteriorOik)
-self.setTabOrder(self.cbSelTibialisPosteriorOik, self.cbSelTibialisPosteriorVas)
-self.setTabOrder(self.cbSelTibialisPosteriorVas, self.cbSelPeroneusOik)
-self.setTabOrder(self.cbSelPeroneusOik, self.cbSelPeroneusVas)
-self.setTabOrder(self.cbSelPeroneusVas, self.cbSelExtHallucisLongusOik)
-self.setTabOrder(self.cbSelExtHallucisLongusOik, self.cbSelExtHallucisLongusVas)
-self.setTabOrder(self.cbSelExtHallucisLongusVas, self.cbSelFlexHallucisLongusOik)
-self.setTabOrder(self.cbSelFlexHallucisLongusOik, self.cbSelFlexHallucisLongusVas)
-self.setTabOrder(self.cbSelFlexHallucisLongusVas, self.cbSel25OjennusOik)
-self.setTabOrder(self.cbSel25OjennusOik, self.cbSel25OjennusVas)
-self.setTabOrder(self.cbSel25OjennusVas, self.cbSel25KoukistusOik)
-self.setTabOrder(self.cbSel25KoukistusOik, self.cbSel25KoukistusVas)
-self.setTabOrder(self.cbSel25KoukistusVas, self.cbSelGastroOik)
-self.setTabOrder(self.cbSelGastroOik, self.cbSelGastroVas)
-self.setTabOrder(self.cbSelGastroVas, self.cbSelSoleusOik)
-self.setTabOrder(self.cbSelSoleusOik, self.cbSelSoleusVas)
-self.setTabOrder(self.cbSelSoleusVas, self.spVirheasAnteversioOik)
-self.setTabOrder(self.spVirheasAnteversioOik, self.spVirheasAnteversioVas)
-self.setTabOrder(self.spVirheasAnteversioVas, self.spVirheasPatellaAltaOik)
-self.setTabOrder(self.spVirheasPatellaAltaOik, self.spVirheasPatellaAltaVas)
-self.setTabOrder(self.spVirheasPatellaAltaVas, self.lnPolvenValgusOik)
-self.setTabOrder(self.lnPolvenValgusOik, self.lnPolvenValgusVas)
-self.setTabOrder(self.lnPolvenValgusVas, self.spQkulmaOik)
-self.setTabOrder(self.spQkulmaOik, self.spQkulmaVas)
-self.setTabOrder(self.spQkulmaVas, self.spVirheasJalkaReisiOik)
-self.setTabOrder(self.spVirheasJalkaReisiOik, self.spVirheasJalkaReisiVas)
-self.setTabOrder(self.spVirheasJalkaReisiVas, self.spVirheasJalkateraEtuTakaOik)
-self.setTabOrder(self.spVirheasJalkateraEtuTakaOik, self.spVirheasJalkateraEtuTakaVas)
-self.setTabOrder(self.spVirheasJalkateraEtuTakaVas, self.spVirheasBimalleoliOik)
-self.setTabOrder(self.spVirheasBimalleoliOik, self.spVirheasBimalleoliVas)
-self.setTabOrder(self.spVirheasBimalleoliVas, self.spVirheas2ndtoeOik)
-self.setTabOrder(self.spVirheas2ndtoeOik, self.spVirheas2ndtoeVas)
-self.setTabOrder(self.spVirheas2ndtoeVas, self.cmtVirheas)
-self.setTabOrder(self.cmtVirheas, self.spTasapOik)
-self.setTabOrder(self.spTasapOik, self.spTasapVas)
-self.setTabOrder(self.spTasapVas, self.cmtTasap)
-self.setTabOrder(self.cmtTasap, self.xbEMGTibA)
-self.setTabOrder(self.xbEMGTibA, self.xbEMGPer)
-self.setTabOrder(self.xbEMGPer, self.xbEMGSol)
-self.setTabOrder(self.xbEMGSol, self.xbEMGGas)
-self.setTabOrder(self.xbEMGGas, self.xbEMGRec)
-self.setTabOrder(self.xbEMGRec, self.xbEMGVas)
-self.setTabOrder(self.xbEMGVas, self.xbEMGHam)
-self.setTabOrder(self.xbEMGHam, self.xbEMGGlut)
-self.setTabOrder(self.xbEMGGlut, self.scrollArea)
-self.setTabOrder(self.scrollArea, self.maintab)
-self.setTabOrder(self.maintab, self.spIsokinPolviEkstensioOik)
-self.setTabOrder(self.spIsokinPolviEkstensioOik, self.spIsokinPolviEkstensioVas)
-self.setTabOrder(self.spIsokinPolviEkstensioVas, self.spIsokinPolviFleksioOik)
-self.setTabOrder(self.spIsokinPolviFleksioOik, self.spIsokinPolviFleksioVas)
-self.setTabOrder(self.spIsokinPolviFleksioVas, self.spIsokinPolviEkstensioMomenttiOikNormUn)
-self.setTabOrder(self.spIsokinPolviEkstensioMomenttiOikNormUn, self.spIsokinPolviEkstensioMomenttiVasNormUn)
-self.setTabOrder(self.spIsokinPolviEkstensioMomenttiVasNormUn, self.spIsokinPolviEkstensioMomenttiOikNorm)
-self.setTabOrder(self.spIsokinPolviEkstensioMomenttiOikNorm, self.spIsokinPolviEkstensioMomenttiVasNorm)
-self.setTabOrder(self.spIsokinPolviEkstensioMomenttiVasNorm, self.spIsokinPolviLiikenopeusEkstensioOik)
-self.setTabOrder(self.spIsokinPolviLiikenopeusEkstensioOik, self.spIsokinPolviLiikenopeusEkstensioVas)
-self.setTabOrder(self.spIsokinPolviLiikenopeusEkstensioVas, self.spIsokinPolviFleksioMomenttiOikNormUn)
-self.setTabOrder(self.spIsokinPolviFleksioMomenttiOikNormUn, self.spIsokinPolviFleksioMomenttiVasNormUn)
-self.setTabOrder(self.spIsokinPolviFleksioMomenttiVasNormUn, self.spIsokinPolviFleksioMomenttiOikNorm)
-self.setTabOrder(self.spIsokinPolviFleksioMomenttiOikNorm, self.spIsokinPolviFleksioMomenttiVasNorm)
-self.setTabOrder(self.spIsokinPolviFleksioMomenttiVasNorm, self.spIsokinPolviLiikenopeusFleksioOik)
-self.setTabOrder(self.spIsokinPolviLiikenopeusFleksioOik, self.spIsokinPolviLiikenopeusFleksioVas)
-self.setTabOrder(self.spIsokinPolviLiikenopeusFleksioVas, self.spIsokinNilkkaPlantaarifleksioOik)
-self.setTabOrder(self.spIsokinNilkkaPlantaarifleksioOik, self.spIsokinNilkkaPlantaarifleksioVas)
-self.setTabOrder(self.spIsokinNilkkaPlantaarifleksioVas, self.spIsokinNilkkaDorsifleksioOik)
-self.setTabOrder(self.spIsokinNilkkaDorsifleksioOik, self.spIsokinNilkkaDorsifleksioVas)
-self.setTabOrder(self.spIsokinNilkkaDorsifleksioVas, self.spIsokinNilkkaPlantaarifleksioMomenttiOikNormUn)
-self.setTabOrder(self.spIsokinNilkkaPlantaarifleksioMomenttiOikNormUn, self.spIsokinNilkkaPlantaarifleksioMomenttiVasNormUn)
-self.setTabOrder(self.spIsokinNilkkaPlantaarifleksioMomenttiVasNormUn, self.spIsokinNilkkaPlantaarifleksioMomenttiOikNorm)
-self.setTabOrder(self.spIsokinNilkkaPlantaarifleksioMomenttiOikNorm, self.spIsokinNilkkaPlantaarifleksioMomenttiVasNorm)
-self.setTabOrder(self.spIsokinNilkkaPlantaarifleksioMomenttiVasNorm, self.spIsokinNilkkaLiikenopeusPlantaarifleksioOik)
-self.setTabOrder(self.spIsokinNilkkaLiikenopeusPlantaarifleksioOik, self.spIsokinNilkkaLiikenopeusPlantaarifleksioVas)
-self.setTabOrder(self.spIsokinNilkkaLiikenopeusPlantaarifleksioVas, self.spIsokinNilkkaDorsifleksioMomenttiOikNormUn)
-self.setTabOrder(self.spIsokinNilkkaDorsifleksioMomenttiOikNormUn, self.spIsokinNilkkaDorsifleksioMomenttiVasNormUn)
-self.setTabOrder(self.spIsokinNilkkaDorsifleksioMomenttiVasNormUn, self.spIsokinNilkkaDorsifleksioMomenttiOikNorm)
-self.setTabOrder(self.spIsokinNilkkaDorsifleksioMomenttiOikNorm, self.spIsokinNilkkaDorsifleksioMomenttiVasNorm)
-self.setTabOrder(self.spIsokinNilkkaDorsifleksioMomenttiVasNorm, self.spIsokinNilkkaLiikenopeusDorsifleksioOik)
-self.setTabOrder(self.spIsokinNilkkaLiikenopeusDorsifleksioOik, self.spIsokinNilkkaLiikenopeusDorsifleksioVas)
-self.setTabOrder(self.spIsokinNilkkaLiikenopeusDorsifleksioVas, self.cmtIsokin)
+# -*- coding: utf-8 -*-
+"""
+Explicit tab order for the main window. Generated code, see
+EntryApp.__init__() for how to regenerate it.
+"""
+
+
+def fix_taborder(self):
+    """Set the tab order of the input widgets of main window self"""
+    self.setTabOrder(self.lnTiedotNimi, self.lnTiedotPvm)
+    self.setTabOrder(self.lnTiedotPvm, self.lnTiedotDiag)
+    self.setTabOrder(self.lnTiedotDiag, self.lnTiedotID)
+    self.setTabOrder(self.lnTiedotID, self.lnTiedotHetu)
+    self.setTabOrder(self.lnTiedotHetu, self.lnTiedotMittaajat)
+    self.setTabOrder(self.lnTiedotMittaajat, self.cmtTiedot)
+    self.setTabOrder(self.cmtTiedot, self.lnKyselyPaivittainenMatka)
+    self.setTabOrder(self.lnKyselyPaivittainenMatka, self.cbKyselyPaivittainenYhtajaksMatkaApuv)
+    self.setTabOrder(self.cbKyselyPaivittainenYhtajaksMatkaApuv, self.cbKyselyPaivittainenYhtajaksMatkaIlmanApuv)
+    self.setTabOrder(self.cbKyselyPaivittainenYhtajaksMatkaIlmanApuv, self.cbFMSLyhyetMatkat)
+    self.setTabOrder(self.cbFMSLyhyetMatkat, self.cbFMSKoulussa)
+    self.setTabOrder(self.cbFMSKoulussa, self.cbFMSPitkatMatkat)
+    self.setTabOrder(self.cbFMSPitkatMatkat, self.lnKyselyApuvRajoittavat)
+    self.setTabOrder(self.lnKyselyApuvRajoittavat, self.lnKyselyApuvKaytossa)
+    self.setTabOrder(self.lnKyselyApuvKaytossa, self.lnKyselyApuvMuutokset)
+    self.setTabOrder(self.lnKyselyApuvMuutokset, self.xbKyselyFAQEiAskeleita)
+    self.setTabOrder(self.xbKyselyFAQEiAskeleita, self.xbKyselyFAQAskellanTuettuna)
+    self.setTabOrder(self.xbKyselyFAQAskellanTuettuna, self.xbKyselyFAQKavelenTerapiassa)
+    self.setTabOrder(self.xbKyselyFAQKavelenTerapiassa, self.xbKyselyFAQKavelenLyhyitaMatkojaKotona)
+    self.setTabOrder(self.xbKyselyFAQKavelenLyhyitaMatkojaKotona, self.xbKyselyFAQKavelenJonkinVerranSisalla)
+    self.setTabOrder(self.xbKyselyFAQKavelenJonkinVerranSisalla, self.xbKyselyKavelenJonkinVerranUlkona)
+    self.setTabOrder(self.xbKyselyKavelenJonkinVerranUlkona, self.xbKyselyFAQKavelenPitempiaMatkojaUlkonaTasaisella)
+    self.setTabOrder(self.xbKyselyFAQKavelenPitempiaMatkojaUlkonaTasaisella, self.xbKyselyFAQKavelenPitempiaMatkojaUlkonaEpatasaisellaApua)
+    self.setTabOrder(self.xbKyselyFAQKavelenPitempiaMatkojaUlkonaEpatasaisellaApua, self.xbKyselyFAQKavelenUlkonaEpatasaisellaPientaApua)
+    self.setTabOrder(self.xbKyselyFAQKavelenUlkonaEpatasaisellaPientaApua, self.xbKyselyFAQKavelenUlkonaKaikissaMaastoissa)
+    self.setTabOrder(self.xbKyselyFAQKavelenUlkonaKaikissaMaastoissa, self.lnKyselyFAQKOmmentit)
+    self.setTabOrder(self.lnKyselyFAQKOmmentit, self.xbKyselyKipujaViim6kk)
+    self.setTabOrder(self.xbKyselyKipujaViim6kk, self.lnKyselyKipuKuvaus)
+    self.setTabOrder(self.lnKyselyKipuKuvaus, self.cmtKysely)
+    self.setTabOrder(self.cmtKysely, self.spAntropAlaraajaOik)
+    self.setTabOrder(self.spAntropAlaraajaOik, self.spAntropAlaraajaVas)
+    self.setTabOrder(self.spAntropAlaraajaVas, self.spAntropPolviOik)
+    self.setTabOrder(self.spAntropPolviOik, self.spAntropPolviVas)
+    self.setTabOrder(self.spAntropPolviVas, self.spAntropNilkkaOik)
+    self.setTabOrder(self.spAntropNilkkaOik, self.spAntropNilkkaVas)
+    self.setTabOrder(self.spAntropNilkkaVas, self.spAntropJalkateraOik)
+    self.setTabOrder(self.spAntropJalkateraOik, self.spAntropJalkateraVas)
+    self.setTabOrder(self.spAntropJalkateraVas, self.spAntropSIAS)
+    self.setTabOrder(self.spAntropSIAS, self.spAntropPituus)
+    self.setTabOrder(self.spAntropPituus, self.spAntropPaino)
+    self.setTabOrder(self.spAntropPaino, self.spAntropKenganNumeroOik)
+    self.setTabOrder(self.spAntropKenganNumeroOik, self.spAntropKenganNumeroVas)
+    self.setTabOrder(self.spAntropKenganNumeroVas, self.spAntropKenganPituusOik)
+    self.setTabOrder(self.spAntropKenganPituusOik, self.spAntropKenganPituusVas)
+    self.setTabOrder(self.spAntropKenganPituusVas, self.cmtAntrop)
+    self.setTabOrder(self.cmtAntrop, self.csbLonkkaFleksioOik.focusProxy())
+    self.setTabOrder(self.csbLonkkaFleksioOik.focusProxy(), self.csbLonkkaFleksioVas.focusProxy())
+    self.setTabOrder(self.csbLonkkaFleksioVas.focusProxy(), self.csbLonkkaEkstensioVapOik.focusProxy())
+    self.setTabOrder(self.csbLonkkaEkstensioVapOik.focusProxy(), self.csbLonkkaEkstensioVapVas.focusProxy())
+    self.setTabOrder(self.csbLonkkaEkstensioVapVas.focusProxy(), self.csbLonkkaEkstensioAvOik.focusProxy())
+    self.setTabOrder(self.csbLonkkaEkstensioAvOik.focusProxy(), self.csbLonkkaEkstensioAvVas.focusProxy())
+    self.setTabOrder(self.csbLonkkaEkstensioAvVas.focusProxy(), self.csbLonkkaEkstensioPolvi90Oik.focusProxy())
+    self.setTabOrder(self.csbLonkkaEkstensioPolvi90Oik.focusProxy(), self.csbLonkkaEkstensioPolvi90Vas.focusProxy())
+    self.setTabOrder(self.csbLonkkaEkstensioPolvi90Vas.focusProxy(), self.csbLonkkaExtLagOik.focusProxy())
+    self.setTabOrder(self.csbLonkkaExtLagOik.focusProxy(), self.csbLonkkaExtLagVas.focusProxy())
+    self.setTabOrder(self.csbLonkkaExtLagVas.focusProxy(), self.csbLonkkaAbduktioLonkka0Polvi90Oik.focusProxy())
+    self.setTabOrder(self.csbLonkkaAbduktioLonkka0Polvi90Oik.focusProxy(), self.csbLonkkaAbduktioLonkka0Polvi90Vas.focusProxy())
+    self.setTabOrder(self.csbLonkkaAbduktioLonkka0Polvi90Vas.focusProxy(), self.csbLonkkaAdduktoritCatchOik.focusProxy())
+    self.setTabOrder(self.csbLonkkaAdduktoritCatchOik.focusProxy(), self.csbLonkkaAdduktoritCatchVas.focusProxy())
+    self.setTabOrder(self.csbLonkkaAdduktoritCatchVas.focusProxy(), self.csbLonkkaAbduktioLonkka0Oik.focusProxy())
+    self.setTabOrder(self.csbLonkkaAbduktioLonkka0Oik.focusProxy(), self.csbLonkkaAbduktioLonkka0Vas.focusProxy())
+    self.setTabOrder(self.csbLonkkaAbduktioLonkka0Vas.focusProxy(), self.csbLonkkaAbduktioLonkkaFleksOik.focusProxy())
+    self.setTabOrder(self.csbLonkkaAbduktioLonkkaFleksOik.focusProxy(), self.csbLonkkaAbduktioLonkkaFleksVas.focusProxy())
+    self.setTabOrder(self.csbLonkkaAbduktioLonkkaFleksVas.focusProxy(), self.csbLonkkaAdduktioOik.focusProxy())
+    self.setTabOrder(self.csbLonkkaAdduktioOik.focusProxy(), self.csbLonkkaAdduktioVas.focusProxy())
+    self.setTabOrder(self.csbLonkkaAdduktioVas.focusProxy(), self.lnLonkkaOberOik)
+    self.setTabOrder(self.lnLonkkaOberOik, self.lnLonkkaOberVas)
+    self.setTabOrder(self.lnLonkkaOberVas, self.csbLonkkaSisakiertoOik.focusProxy())
+    self.setTabOrder(self.csbLonkkaSisakiertoOik.focusProxy(), self.csbLonkkaSisakiertoVas.focusProxy())
+    self.setTabOrder(self.csbLonkkaSisakiertoVas.focusProxy(), self.csbLonkkaUlkokiertoOik.focusProxy())
+    self.setTabOrder(self.csbLonkkaUlkokiertoOik.focusProxy(), self.csbLonkkaUlkokiertoVas.focusProxy())
+    self.setTabOrder(self.csbLonkkaUlkokiertoVas.focusProxy(), self.cmtLonkkaPROM)
+    self.setTabOrder(self.cmtLonkkaPROM, self.cmtLonkkaMuut)
+    self.setTabOrder(self.cmtLonkkaMuut, self.cbLonkkaFleksioModAOik)
+    self.setTabOrder(self.cbLonkkaFleksioModAOik, self.cbLonkkaFleksioModAVas)
+    self.setTabOrder(self.cbLonkkaFleksioModAVas, self.cbLonkkaEkstensioModAOik)
+    self.setTabOrder(self.cbLonkkaEkstensioModAOik, self.cbLonkkaEkstensioModAVas)
+    self.setTabOrder(self.cbLonkkaEkstensioModAVas, self.cbLonkkaAdduktoritModAOik)
+    self.setTabOrder(self.cbLonkkaAdduktoritModAOik, self.cbLonkkaAdduktoritModAVas)
+    self.setTabOrder(self.cbLonkkaAdduktoritModAVas, self.cbLonkkaSisakiertoModAOik)
+    self.setTabOrder(self.cbLonkkaSisakiertoModAOik, self.cbLonkkaSisakiertoModAVas)
+    self.setTabOrder(self.cbLonkkaSisakiertoModAVas, self.cbLonkkaUlkokiertoModAOik)
+    self.setTabOrder(self.cbLonkkaUlkokiertoModAOik, self.cbLonkkaUlkokiertoModAVas)
+    self.setTabOrder(self.cbLonkkaUlkokiertoModAVas, self.cmtLonkkaSpast)
+    self.setTabOrder(self.cmtLonkkaSpast, self.csbPolviEkstensioVapOik.focusProxy())
+    self.setTabOrder(self.csbPolviEkstensioVapOik.focusProxy(), self.csbPolviEkstensioVapVas.focusProxy())
+    self.setTabOrder(self.csbPolviEkstensioVapVas.focusProxy(), self.csbPolviEkstensioAvOik.focusProxy())
+    self.setTabOrder(self.csbPolviEkstensioAvOik.focusProxy(), self.csbPolviEkstensioAvVas.focusProxy())
+    self.setTabOrder(self.csbPolviEkstensioAvVas.focusProxy(), self.csbPolviFleksioSelinmakuuOik.focusProxy())
+    self.setTabOrder(self.csbPolviFleksioSelinmakuuOik.focusProxy(), self.csbPolviFleksioSelinmakuuVas.focusProxy())
+    self.setTabOrder(self.csbPolviFleksioSelinmakuuVas.focusProxy(), self.csbPolviFleksioVatsamakuuOik.focusProxy())
+    self.setTabOrder(self.csbPolviFleksioVatsamakuuOik.focusProxy(), self.csbPolviFleksioVatsamakuuVas.focusProxy())
+    self.setTabOrder(self.csbPolviFleksioVatsamakuuVas.focusProxy(), self.csbPolviRectusCatchOik.focusProxy())
+    self.setTabOrder(self.csbPolviRectusCatchOik.focusProxy(), self.csbPolviRectusCatchVas.focusProxy())
+    self.setTabOrder(self.csbPolviRectusCatchVas.focusProxy(), self.csbPolviHamstringCatchOik.focusProxy())
+    self.setTabOrder(self.csbPolviHamstringCatchOik.focusProxy(), self.csbPolviHamstringCatchVas.focusProxy())
+    self.setTabOrder(self.csbPolviHamstringCatchVas.focusProxy(), self.csbPolviPopliteaVastakkLonkka0Oik.focusProxy())
+    self.setTabOrder(self.csbPolviPopliteaVastakkLonkka0Oik.focusProxy(), self.csbPolviPopliteaVastakkLonkka0Vas.focusProxy())
+    self.setTabOrder(self.csbPolviPopliteaVastakkLonkka0Vas.focusProxy(), self.csbPolviPopliteaVastakkLonkka90Oik.focusProxy())
+    self.setTabOrder(self.csbPolviPopliteaVastakkLonkka90Oik.focusProxy(), self.csbPolviPopliteaVastakkLonkka90Vas.focusProxy())
+    self.setTabOrder(self.csbPolviPopliteaVastakkLonkka90Vas.focusProxy(), self.cmtPolviPROM)
+    self.setTabOrder(self.cmtPolviPROM, self.cmtPolviSpast)
+    self.setTabOrder(self.cmtPolviSpast, self.cbPolviRectusModAOik)
+    self.setTabOrder(self.cbPolviRectusModAOik, self.cbPolviRectusModAVas)
+    self.setTabOrder(self.cbPolviRectusModAVas, self.cbPolviHamstringModAOik)
+    self.setTabOrder(self.cbPolviHamstringModAOik, self.cbPolviHamstringModAVas)
+    self.setTabOrder(self.cbPolviHamstringModAVas, self.csbNilkkaSoleusCatchOik.focusProxy())
+    self.setTabOrder(self.csbNilkkaSoleusCatchOik.focusProxy(), self.xbNilkkaSoleusKlonusOik)
+    self.setTabOrder(self.xbNilkkaSoleusKlonusOik, self.csbNilkkaDorsifPolvi90PROMOik.focusProxy())
+    self.setTabOrder(self.csbNilkkaDorsifPolvi90PROMOik.focusProxy(), self.xbNilkkaDorsifPolvi90AROMEversioOik)
+    self.setTabOrder(self.xbNilkkaDorsifPolvi90AROMEversioOik, self.csbNilkkaDorsifPolvi90AROMOik.focusProxy())
+    self.setTabOrder(self.csbNilkkaDorsifPolvi90AROMOik.focusProxy(), self.xbNilkkaGastroKlonusOik)
+    self.setTabOrder(self.xbNilkkaGastroKlonusOik, self.csbNilkkaGastroCatchOik.focusProxy())
+    self.setTabOrder(self.csbNilkkaGastroCatchOik.focusProxy(), self.csbNilkkaDorsifPolvi0PROMOik.focusProxy())
+    self.setTabOrder(self.csbNilkkaDorsifPolvi0PROMOik.focusProxy(), self.csbNilkkaDorsifPolvi0AROMOik.focusProxy())
+    self.setTabOrder(self.csbNilkkaDorsifPolvi0AROMOik.focusProxy(), self.xbNilkkaDorsifPolvi0AROMEversioOik)
+    self.setTabOrder(self.xbNilkkaDorsifPolvi0AROMEversioOik, self.csbNilkkaPlantaarifleksioPROMOik.focusProxy())
+    self.setTabOrder(self.csbNilkkaPlantaarifleksioPROMOik.focusProxy(), self.csbNilkkaPlantaarifleksioAROMOik.focusProxy())
+    self.setTabOrder(self.csbNilkkaPlantaarifleksioAROMOik.focusProxy(), self.lnNilkkaConfusionOik)
+    self.setTabOrder(self.lnNilkkaConfusionOik, self.csbNilkkaSoleusCatchVas.focusProxy())
+    self.setTabOrder(self.csbNilkkaSoleusCatchVas.focusProxy(), self.xbNilkkaSoleusKlonusVas)
+    self.setTabOrder(self.xbNilkkaSoleusKlonusVas, self.csbNilkkaDorsifPolvi90PROMVas.focusProxy())
+    self.setTabOrder(self.csbNilkkaDorsifPolvi90PROMVas.focusProxy(), self.csbNilkkaDorsifPolvi90AROMVas.focusProxy())
+    self.setTabOrder(self.csbNilkkaDorsifPolvi90AROMVas.focusProxy(), self.xbNilkkaDorsifPolvi90AROMEversioVas)
+    self.setTabOrder(self.xbNilkkaDorsifPolvi90AROMEversioVas, self.csbNilkkaGastroCatchVas.focusProxy())
+    self.setTabOrder(self.csbNilkkaGastroCatchVas.focusProxy(), self.xbNilkkaGastroKlonusVas)
+    self.setTabOrder(self.xbNilkkaGastroKlonusVas, self.csbNilkkaDorsifPolvi0PROMVas.focusProxy())
+    self.setTabOrder(self.csbNilkkaDorsifPolvi0PROMVas.focusProxy(), self.csbNilkkaDorsifPolvi0AROMVas.focusProxy())
+    self.setTabOrder(self.csbNilkkaDorsifPolvi0AROMVas.focusProxy(), self.xbNilkkaDorsifPolvi0AROMEversioVas)
+    self.setTabOrder(self.xbNilkkaDorsifPolvi0AROMEversioVas, self.csbNilkkaPlantaarifleksioPROMVas.focusProxy())
+    self.setTabOrder(self.csbNilkkaPlantaarifleksioPROMVas.focusProxy(), self.csbNilkkaPlantaarifleksioAROMVas.focusProxy())
+    self.setTabOrder(self.csbNilkkaPlantaarifleksioAROMVas.focusProxy(), self.lnNilkkaConfusionVas)
+    self.setTabOrder(self.lnNilkkaConfusionVas, self.cmtNilkkaPROM)
+    self.setTabOrder(self.cmtNilkkaPROM, self.cmtNilkkaAROM)
+    self.setTabOrder(self.cmtNilkkaAROM, self.cmtNilkkaSpast)
+    self.setTabOrder(self.cmtNilkkaSpast, self.cbNilkkaSoleusModAOik)
+    self.setTabOrder(self.cbNilkkaSoleusModAOik, self.cbNilkkaSoleusModAVas)
+    self.setTabOrder(self.cbNilkkaSoleusModAVas, self.cbNilkkaGastroModAOik)
+    self.setTabOrder(self.cbNilkkaGastroModAOik, self.cbNilkkaGastroModAVas)
+    self.setTabOrder(self.cbNilkkaGastroModAVas, self.cbJalkatSubtalarOik)
+    self.setTabOrder(self.cbJalkatSubtalarOik, self.cbJalkatSubtalarVas)
+    self.setTabOrder(self.cbJalkatSubtalarVas, self.cbJalkatTakaosanAsentoOik)
+    self.setTabOrder(self.cbJalkatTakaosanAsentoOik, self.cbJalkatTakaosanAsentoVas)
+    self.setTabOrder(self.cbJalkatTakaosanAsentoVas, self.cbJalkatTakaosanLiikeEversioOik)
+    self.setTabOrder(self.cbJalkatTakaosanLiikeEversioOik, self.cbJalkatTakaosanLiikeEversioVas)
+    self.setTabOrder(self.cbJalkatTakaosanLiikeEversioVas, self.cbJalkatTakaosanLiikeInversioOik)
+    self.setTabOrder(self.cbJalkatTakaosanLiikeInversioOik, self.cbJalkatTakaosanLiikeInversioVas)
+    self.setTabOrder(self.cbJalkatTakaosanLiikeInversioVas, self.cbJalkatHolvikaariOik)
+    self.setTabOrder(self.cbJalkatHolvikaariOik, self.cbJalkatHolvikaariVas)
+    self.setTabOrder(self.cbJalkatHolvikaariVas, self.cbJalkatKeskiosanliikeOik)
+    self.setTabOrder(self.cbJalkatKeskiosanliikeOik, self.cbJalkatKeskiosanliikeVas)
+    self.setTabOrder(self.cbJalkatKeskiosanliikeVas, self.cbJalkatEtuosanAsento1Oik)
+    self.setTabOrder(self.cbJalkatEtuosanAsento1Oik, self.cbJalkatEtuosanAsento1Vas)
+    self.setTabOrder(self.cbJalkatEtuosanAsento1Vas, self.cbJalkatEtuosanAsento2Oik)
+    self.setTabOrder(self.cbJalkatEtuosanAsento2Oik, self.cbJalkatEtuosanAsento2Vas)
+    self.setTabOrder(self.cbJalkatEtuosanAsento2Vas, self.cbJalkat1sadeOik)
+    self.setTabOrder(self.cbJalkat1sadeOik, self.cbJalkat1sadeVas)
+    self.setTabOrder(self.cbJalkat1sadeVas, self.csbJalkat1MTPojennusOik.focusProxy())
+    self.setTabOrder(self.csbJalkat1MTPojennusOik.focusProxy(), self.csbJalkat1MTPojennusVas.focusProxy())
+    self.setTabOrder(self.csbJalkat1MTPojennusVas.focusProxy(), self.cbJalkatVaivaisenluuOik)
+    self.setTabOrder(self.cbJalkatVaivaisenluuOik, self.cbJalkatVaivaisenluuVas)
+    self.setTabOrder(self.cbJalkatVaivaisenluuVas, self.lnJalkatKovettumatOik)
+    self.setTabOrder(self.lnJalkatKovettumatOik, self.lnJalkatKovettumatVas)
+    self.setTabOrder(self.lnJalkatKovettumatVas, self.cmtJalkateraKuormittamattomana)
+    self.setTabOrder(self.cmtJalkateraKuormittamattomana, self.cmtJalkateraKuormitettuna)
+    self.setTabOrder(self.cmtJalkateraKuormitettuna, self.cbJalkatTakaosanAsentoKuormOik)
+    self.setTabOrder(self.cbJalkatTakaosanAsentoKuormOik, self.cbJalkatTakaosanAsentoKuormVas)
+    self.setTabOrder(self.cbJalkatTakaosanAsentoKuormVas, self.cbJalkatTakaosanKiertoKuormOik)
+    self.setTabOrder(self.cbJalkatTakaosanKiertoKuormOik, self.cbJalkatTakaosanKiertoKuormVas)
+    self.setTabOrder(self.cbJalkatTakaosanKiertoKuormVas, self.cbJalkatKeskiosanAsentoKuormOik)
+    self.setTabOrder(self.cbJalkatKeskiosanAsentoKuormOik, self.cbJalkatKeskiosanAsentoKuormVas)
+    self.setTabOrder(self.cbJalkatKeskiosanAsentoKuormVas, self.cbJalkatEtuosanAsento1KuormOik)
+    self.setTabOrder(self.cbJalkatEtuosanAsento1KuormOik, self.cbJalkatEtuosanAsento1KuormVas)
+    self.setTabOrder(self.cbJalkatEtuosanAsento1KuormVas, self.cbJalkatEtuosanAsento2KuormOik)
+    self.setTabOrder(self.cbJalkatEtuosanAsento2KuormOik, self.cbJalkatEtuosanAsento2KuormVas)
+    self.setTabOrder(self.cbJalkatEtuosanAsento2KuormVas, self.cbJalkatFeissinLinjaOik)
+    self.setTabOrder(self.cbJalkatFeissinLinjaOik, self.cbJalkatFeissinLinjaVas)
+    self.setTabOrder(self.cbJalkatFeissinLinjaVas, self.spJalkatNavDropIstuenOik)
+    self.setTabOrder(self.spJalkatNavDropIstuenOik, self.spJalkatNavDropIstuenVas)
+    self.setTabOrder(self.spJalkatNavDropIstuenVas, self.spJalkatNavDropSeistenOik)
+    self.setTabOrder(self.spJalkatNavDropSeistenOik, self.spJalkatNavDropSeistenVas)
+    self.setTabOrder(self.spJalkatNavDropSeistenVas, self.lnJalkatColemanOik)
+    self.setTabOrder(self.lnJalkatColemanOik, self.lnJalkatColemanVas)
+    self.setTabOrder(self.lnJalkatColemanVas, self.xbPainelevy)
+    self.setTabOrder(self.xbPainelevy, self.lnJalkatPainelevyTiedot)
+    self.setTabOrder(self.lnJalkatPainelevyTiedot, self.cbVoimaLonkkaEkstensioPolvi0Oik)
+    self.setTabOrder(self.cbVoimaLonkkaEkstensioPolvi0Oik, self.cbVoimaLonkkaEkstensioPolvi0Vas)
+    self.setTabOrder(self.cbVoimaLonkkaEkstensioPolvi0Vas, self.cbVoimaLonkkaEkstensioPolvi90Oik)
+    self.setTabOrder(self.cbVoimaLonkkaEkstensioPolvi90Oik, self.cbVoimaLonkkaEkstensioPolvi90Vas)
+    self.setTabOrder(self.cbVoimaLonkkaEkstensioPolvi90Vas, self.cbVoimaPolviFleksioOik)
+    self.setTabOrder(self.cbVoimaPolviFleksioOik, self.cbVoimaPolviFleksioVas)
+    self.setTabOrder(self.cbVoimaPolviFleksioVas, self.cbVoimaLonkkaAbduktioLonkka0Oik)
+    self.setTabOrder(self.cbVoimaLonkkaAbduktioLonkka0Oik, self.cbVoimaLonkkaAbduktioLonkka0Vas)
+    self.setTabOrder(self.cbVoimaLonkkaAbduktioLonkka0Vas, self.cbVoimaLonkkaAbduktioLonkkaFleksOik)
+    self.setTabOrder(self.cbVoimaLonkkaAbduktioLonkkaFleksOik, self.cbVoimaLonkkaAbduktioLonkkaFleksVas)
+    self.setTabOrder(self.cbVoimaLonkkaAbduktioLonkkaFleksVas, self.cbVoimaLonkkaAdduktioOik)
+    self.setTabOrder(self.cbVoimaLonkkaAdduktioOik, self.cbVoimaLonkkaAdduktioVas)
+    self.setTabOrder(self.cbVoimaLonkkaAdduktioVas, self.cbVoimaSelka)
+    self.setTabOrder(self.cbVoimaSelka, self.cbVoimaVatsaSuorat)
+    self.setTabOrder(self.cbVoimaVatsaSuorat, self.cbVoimaVatsaVinotOik)
+    self.setTabOrder(self.cbVoimaVatsaVinotOik, self.cbVoimaVatsaVinotVas)
+    self.setTabOrder(self.cbVoimaVatsaVinotVas, self.cbVoimaLonkkaFleksioOik)
+    self.setTabOrder(self.cbVoimaLonkkaFleksioOik, self.cbVoimaLonkkaFleksioVas)
+    self.setTabOrder(self.cbVoimaLonkkaFleksioVas, self.cbVoimaPolviEkstensioOik)
+    self.setTabOrder(self.cbVoimaPolviEkstensioOik, self.cbVoimaPolviEkstensioVas)
+    self.setTabOrder(self.cbVoimaPolviEkstensioVas, self.cbVoimaLonkkaUlkokiertoOik)
+    self.setTabOrder(self.cbVoimaLonkkaUlkokiertoOik, self.cbVoimaLonkkaUlkokiertoVas)
+    self.setTabOrder(self.cbVoimaLonkkaUlkokiertoVas, self.cbVoimaLonkkaSisakiertoOik)
+    self.setTabOrder(self.cbVoimaLonkkaSisakiertoOik, self.cbVoimaLonkkaSisakiertoVas)
+    self.setTabOrder(self.cbVoimaLonkkaSisakiertoVas, self.cmtVoima1)
+    self.setTabOrder(self.cmtVoima1, self.cbSelLonkkaEkstensioPolvi0Oik)
+    self.setTabOrder(self.cbSelLonkkaEkstensioPolvi0Oik, self.cbSelLonkkaEkstensioPolvi0Vas)
+    self.setTabOrder(self.cbSelLonkkaEkstensioPolvi0Vas, self.cbSelLonkkaEkstensioPolvi90Oik)
+    self.setTabOrder(self.cbSelLonkkaEkstensioPolvi90Oik, self.cbSelLonkkaEkstensioPolvi90Vas)
+    self.setTabOrder(self.cbSelLonkkaEkstensioPolvi90Vas, self.cbSelPolviFleksioOik)
+    self.setTabOrder(self.cbSelPolviFleksioOik, self.cbSelPolviFleksioVas)
+    self.setTabOrder(self.cbSelPolviFleksioVas, self.cbSelLonkkaAbduktioLonkka0Oik)
+    self.setTabOrder(self.cbSelLonkkaAbduktioLonkka0Oik, self.cbSelLonkkaAbduktioLonkka0Vas)
+    self.setTabOrder(self.cbSelLonkkaAbduktioLonkka0Vas, self.cbSelLonkkaAdduktioOik)
+    self.setTabOrder(self.cbSelLonkkaAdduktioOik, self.cbSelLonkkaAdduktioVas)
+    self.setTabOrder(self.cbSelLonkkaAdduktioVas, self.cbSelLonkkaFleksioOik)
+    self.setTabOrder(self.cbSelLonkkaFleksioOik, self.cbSelLonkkaFleksioVas)
+    self.setTabOrder(self.cbSelLonkkaFleksioVas, self.cbSelPolviEkstensioOik)
+    self.setTabOrder(self.cbSelPolviEkstensioOik, self.cbSelPolviEkstensioVas)
+    self.setTabOrder(self.cbSelPolviEkstensioVas, self.cbSelLonkkaUlkokiertoOik)
+    self.setTabOrder(self.cbSelLonkkaUlkokiertoOik, self.cbSelLonkkaUlkokiertoVas)
+    self.setTabOrder(self.cbSelLonkkaUlkokiertoVas, self.cbSelLonkkaSisakiertoOik)
+    self.setTabOrder(self.cbSelLonkkaSisakiertoOik, self.cbSelLonkkaSisakiertoVas)
+    self.setTabOrder(self.cbSelLonkkaSisakiertoVas, self.cbVoimaTibialisAnteriorOik)
+    self.setTabOrder(self.cbVoimaTibialisAnteriorOik, self.cbVoimaTibialisAnteriorVas)
+    self.setTabOrder(self.cbVoimaTibialisAnteriorVas, self.cbVoimaTibialisPosteriorOik)
+    self.setTabOrder(self.cbVoimaTibialisPosteriorOik, self.cbVoimaTibialisPosteriorVas)
+    self.setTabOrder(self.cbVoimaTibialisPosteriorVas, self.cbVoimaPeroneusOik)
+    self.setTabOrder(self.cbVoimaPeroneusOik, self.cbVoimaPeroneusVas)
+    self.setTabOrder(self.cbVoimaPeroneusVas, self.cbVoimaExtHallucisLongusOik)
+    self.setTabOrder(self.cbVoimaExtHallucisLongusOik, self.cbVoimaExtHallucisLongusVas)
+    self.setTabOrder(self.cbVoimaExtHallucisLongusVas, self.cbVoimaFlexHallucisLongusOik)
+    self.setTabOrder(self.cbVoimaFlexHallucisLongusOik, self.cbVoimaFlexHallucisLongusVas)
+    self.setTabOrder(self.cbVoimaFlexHallucisLongusVas, self.cbVoima25OjennusOik)
+    self.setTabOrder(self.cbVoima25OjennusOik, self.cbVoima25OjennusVas)
+    self.setTabOrder(self.cbVoima25OjennusVas, self.cbVoima25KoukistusOik)
+    self.setTabOrder(self.cbVoima25KoukistusOik, self.cbVoima25KoukistusVas)
+    self.setTabOrder(self.cbVoima25KoukistusVas, self.cbVoimaGastroOik)
+    self.setTabOrder(self.cbVoimaGastroOik, self.cbVoimaGastroVas)
+    self.setTabOrder(self.cbVoimaGastroVas, self.cbVoimaSoleusOik)
+    self.setTabOrder(self.cbVoimaSoleusOik, self.cbVoimaSoleusVas)
+    self.setTabOrder(self.cbVoimaSoleusVas, self.cmtVoima2)
+    self.setTabOrder(self.cmtVoima2, self.cbSelTibialisAnteriorOik)
+    self.setTabOrder(self.cbSelTibialisAnteriorOik, self.cbSelTibialisAnteriorVas)
+    self.setTabOrder(self.cbSelTibialisAnteriorVas, self.cbSelTibialisPosteriorOik)
+    self.setTabOrder(self.cbSelTibialisPosteriorOik, self.cbSelTibialisPosteriorVas)
+    self.setTabOrder(self.cbSelTibialisPosteriorVas, self.cbSelPeroneusOik)
+    self.setTabOrder(self.cbSelPeroneusOik, self.cbSelPeroneusVas)
+    self.setTabOrder(self.cbSelPeroneusVas, self.cbSelExtHallucisLongusOik)
+    self.setTabOrder(self.cbSelExtHallucisLongusOik, self.cbSelExtHallucisLongusVas)
+    self.setTabOrder(self.cbSelExtHallucisLongusVas, self.cbSelFlexHallucisLongusOik)
+    self.setTabOrder(self.cbSelFlexHallucisLongusOik, self.cbSelFlexHallucisLongusVas)
+    self.setTabOrder(self.cbSelFlexHallucisLongusVas, self.cbSel25OjennusOik)
+    self.setTabOrder(self.cbSel25OjennusOik, self.cbSel25OjennusVas)
+    self.setTabOrder(self.cbSel25OjennusVas, self.cbSel25KoukistusOik)
+    self.setTabOrder(self.cbSel25KoukistusOik, self.cbSel25KoukistusVas)
+    self.setTabOrder(self.cbSel25KoukistusVas, self.cbSelGastroOik)
+    self.setTabOrder(self.cbSelGastroOik, self.cbSelGastroVas)
+    self.setTabOrder(self.cbSelGastroVas, self.cbSelSoleusOik)
+    self.setTabOrder(self.cbSelSoleusOik, self.cbSelSoleusVas)
+    self.setTabOrder(self.cbSelSoleusVas, self.spVirheasAnteversioOik)
+    self.setTabOrder(self.spVirheasAnteversioOik, self.spVirheasAnteversioVas)
+    self.setTabOrder(self.spVirheasAnteversioVas, self.spVirheasPatellaAltaOik)
+    self.setTabOrder(self.spVirheasPatellaAltaOik, self.spVirheasPatellaAltaVas)
+    self.setTabOrder(self.spVirheasPatellaAltaVas, self.lnPolvenValgusOik)
+    self.setTabOrder(self.lnPolvenValgusOik, self.lnPolvenValgusVas)
+    self.setTabOrder(self.lnPolvenValgusVas, self.spQkulmaOik)
+    self.setTabOrder(self.spQkulmaOik, self.spQkulmaVas)
+    self.setTabOrder(self.spQkulmaVas, self.spVirheasJalkaReisiOik)
+    self.setTabOrder(self.spVirheasJalkaReisiOik, self.spVirheasJalkaReisiVas)
+    self.setTabOrder(self.spVirheasJalkaReisiVas, self.spVirheasJalkateraEtuTakaOik)
+    self.setTabOrder(self.spVirheasJalkateraEtuTakaOik, self.spVirheasJalkateraEtuTakaVas)
+    self.setTabOrder(self.spVirheasJalkateraEtuTakaVas, self.spVirheasBimalleoliOik)
+    self.setTabOrder(self.spVirheasBimalleoliOik, self.spVirheasBimalleoliVas)
+    self.setTabOrder(self.spVirheasBimalleoliVas, self.spVirheas2ndtoeOik)
+    self.setTabOrder(self.spVirheas2ndtoeOik, self.spVirheas2ndtoeVas)
+    self.setTabOrder(self.spVirheas2ndtoeVas, self.cmtVirheas)
+    self.setTabOrder(self.cmtVirheas, self.spTasapOik)
+    self.setTabOrder(self.spTasapOik, self.spTasapVas)
+    self.setTabOrder(self.spTasapVas, self.cmtTasap)
+    self.setTabOrder(self.cmtTasap, self.xbEMGTibA)
+    self.setTabOrder(self.xbEMGTibA, self.xbEMGPer)
+    self.setTabOrder(self.xbEMGPer, self.xbEMGSol)
+    self.setTabOrder(self.xbEMGSol, self.xbEMGGas)
+    self.setTabOrder(self.xbEMGGas, self.xbEMGRec)
+    self.setTabOrder(self.xbEMGRec, self.xbEMGVas)
+    self.setTabOrder(self.xbEMGVas, self.xbEMGHam)
+    self.setTabOrder(self.xbEMGHam, self.xbEMGGlut)
+    self.setTabOrder(self.xbEMGGlut, self.scrollArea)
+    self.setTabOrder(self.scrollArea, self.maintab)
+    self.setTabOrder(self.maintab, self.spIsokinPolviEkstensioOik)
+    self.setTabOrder(self.spIsokinPolviEkstensioOik, self.spIsokinPolviEkstensioVas)
+    self.setTabOrder(self.spIsokinPolviEkstensioVas, self.spIsokinPolviFleksioOik)
+    self.setTabOrder(self.spIsokinPolviFleksioOik, self.spIsokinPolviFleksioVas)
+    self.setTabOrder(self.spIsokinPolviFleksioVas, self.spIsokinPolviEkstensioMomenttiOikNormUn)
+    self.setTabOrder(self.spIsokinPolviEkstensioMomenttiOikNormUn, self.spIsokinPolviEkstensioMomenttiVasNormUn)
+    self.setTabOrder(self.spIsokinPolviEkstensioMomenttiVasNormUn, self.spIsokinPolviEkstensioMomenttiOikNorm)
+    self.setTabOrder(self.spIsokinPolviEkstensioMomenttiOikNorm, self.spIsokinPolviEkstensioMomenttiVasNorm)
+    self.setTabOrder(self.spIsokinPolviEkstensioMomenttiVasNorm, self.spIsokinPolviLiikenopeusEkstensioOik)
+    self.setTabOrder(self.spIsokinPolviLiikenopeusEkstensioOik, self.spIsokinPolviLiikenopeusEkstensioVas)
+    self.setTabOrder(self.spIsokinPolviLiikenopeusEkstensioVas, self.spIsokinPolviFleksioMomenttiOikNormUn)
+    self.setTabOrder(self.spIsokinPolviFleksioMomenttiOikNormUn, self.spIsokinPolviFleksioMomenttiVasNormUn)
+    self.setTabOrder(self.spIsokinPolviFleksioMomenttiVasNormUn, self.spIsokinPolviFleksioMomenttiOikNorm)
+    self.setTabOrder(self.spIsokinPolviFleksioMomenttiOikNorm, self.spIsokinPolviFleksioMomenttiVasNorm)
+    self.setTabOrder(self.spIsokinPolviFleksioMomenttiVasNorm, self.spIsokinPolviLiikenopeusFleksioOik)
+    self.setTabOrder(self.spIsokinPolviLiikenopeusFleksioOik, self.spIsokinPolviLiikenopeusFleksioVas)
+    self.setTabOrder(self.spIsokinPolviLiikenopeusFleksioVas, self.spIsokinNilkkaPlantaarifleksioOik)
+    self.setTabOrder(self.spIsokinNilkkaPlantaarifleksioOik, self.spIsokinNilkkaPlantaarifleksioVas)
+    self.setTabOrder(self.spIsokinNilkkaPlantaarifleksioVas, self.spIsokinNilkkaDorsifleksioOik)
+    self.setTabOrder(self.spIsokinNilkkaDorsifleksioOik, self.spIsokinNilkkaDorsifleksioVas)
+    self.setTabOrder(self.spIsokinNilkkaDorsifleksioVas, self.spIsokinNilkkaPlantaarifleksioMomenttiOikNormUn)
+    self.setTabOrder(self.spIsokinNilkkaPlantaarifleksioMomenttiOikNormUn, self.spIsokinNilkkaPlantaarifleksioMomenttiVasNormUn)
+    self.setTabOrder(self.spIsokinNilkkaPlantaarifleksioMomenttiVasNormUn, self.spIsokinNilkkaPlantaarifleksioMomenttiOikNorm)
+    self.setTabOrder(self.spIsokinNilkkaPlantaarifleksioMomenttiOikNorm, self.spIsokinNilkkaPlantaarifleksioMomenttiVasNorm)
+    self.setTabOrder(self.spIsokinNilkkaPlantaarifleksioMomenttiVasNorm, self.spIsokinNilkkaLiikenopeusPlantaarifleksioOik)
+    self.setTabOrder(self.spIsokinNilkkaLiikenopeusPlantaarifleksioOik, self.spIsokinNilkkaLiikenopeusPlantaarifleksioVas)
+    self.setTabOrder(self.spIsokinNilkkaLiikenopeusPlantaarifleksioVas, self.spIsokinNilkkaDorsifleksioMomenttiOikNormUn)
+    self.setTabOrder(self.spIsokinNilkkaDorsifleksioMomenttiOikNormUn, self.spIsokinNilkkaDorsifleksioMomenttiVasNormUn)
+    self.setTabOrder(self.spIsokinNilkkaDorsifleksioMomenttiVasNormUn, self.spIsokinNilkkaDorsifleksioMomenttiOikNorm)
+    self.setTabOrder(self.spIsokinNilkkaDorsifleksioMomenttiOikNorm, self.spIsokinNilkkaDorsifleksioMomenttiVasNorm)
+    self.setTabOrder(self.spIsokinNilkkaDorsifleksioMomenttiVasNorm, self.spIsokinNilkkaLiikenopeusDorsifleksioOik)
+    self.setTabOrder(self.spIsokinNilkkaLiikenopeusDorsifleksioOik, self.spIsokinNilkkaLiikenopeusDorsifleksioVas)
+    self.setTabOrder(self.spIsokinNilkkaLiikenopeusDorsifleksioVas, self.cmtIsokin)
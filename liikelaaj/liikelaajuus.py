@@ -28,6 +28,8 @@ Design notes:
 -for saving, dict data is turned into json unicode and written out in utf-8
 
 -data is saved into temp directory whenever any values are changed by user
+ (the write is delayed slightly, so that a burst of changes results in a
+ single write)
 
 -for certain inputs, there is a special value indicating "not measured". For
 text inputs, this is just the empty string. For comboboxes, there is a
@@ -56,21 +58,103 @@ import sys
 import traceback
 import os
 import json
-import webbrowser
 import logging
 import importlib
+from collections import defaultdict
+from contextlib import contextmanager
+from types import MappingProxyType, MethodType
 from pathlib import Path
-from pkg_resources import resource_filename
 from ulstools.num import check_hetu
-from ulstools.env import already_running, make_shortcut
+from ulstools.env import make_shortcut
+
+try:
+    from importlib.resources import files
+except ImportError:  # Python < 3.9
+    from pkg_resources import resource_filename
+
+    def files(package):
+        """ Fallback for importlib.resources.files() """
+        return Path(resource_filename(package, ''))
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import Config
-from .widgets import (MyLineEdit, DegLineEdit, CheckDegSpinBox, message_dialog,
-                      confirm_dialog)
-from . import reporter, ll_msgs
+# CheckDegSpinBox is loaded from this module by the .ui files
+from .widgets import (MyLineEdit, DegLineEdit, CheckDegSpinBox,  # noqa: F401
+                      message_dialog, confirm_dialog, run_in_background,
+                      run_with_disabled_actions, INPUT_WIDGET_RE,
+                      widget_prefix, widget_varname, init_checkbox_texts,
+                      widget_ops, WIDGET_ACCESSORS)
+from .fix_taborder import fix_taborder
+from . import ll_msgs
 
 logger = logging.getLogger(__name__)
 
+# paths of package resources
+_PKG_PATH = files('liikelaaj')
+_UI_FILE = str(_PKG_PATH / 'tabbed_design.ui')
+_TEXT_TEMPLATE = str(_PKG_PATH / Config.text_template)
+_ISOKIN_TEXT_TEMPLATE = str(_PKG_PATH / Config.isokin_text_template)
+_XLS_TEMPLATE = str(_PKG_PATH / Config.xls_template)
+
+
+def _dump_json(data, pretty=True):
+    """Serialize data into JSON (utf-8 encoded bytes). Uses orjson if
+    available, since it is a lot faster than the stdlib json module. If
+    pretty is False, the output is compact and the keys are not sorted."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if pretty else 0
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2,
+                          sort_keys=True).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+
+def _write_json(path, data, pretty=True):
+    """Save data into given JSON file. The data is first written into a
+    temporary file which then replaces the target, so that the target never
+    contains partially written data. On failure, the temporary file is
+    removed. See _dump_json() for pretty."""
+    tmp_path = '%s.tmp' % path
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_dump_json(data, pretty=pretty))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_json(buf):
+    """Parse JSON from utf-8 encoded bytes"""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf.decode('utf-8'))
+
+
+def _lock_instance():
+    """Try to acquire the lock file that signals a running instance.
+    Returns the lock (which must be kept alive while the program runs), or
+    None if another instance is holding it. Stale locks left by crashed
+    instances are detected by Qt. If the lock file cannot be created at all
+    (e.g. Config.tmp_path does not exist), a warning is logged and the
+    unlocked lock is returned, so that the program can still be run."""
+    lock = QtCore.QLockFile(str(Config.lockfile_path))
+    if lock.tryLock(0):
+        return lock
+    if lock.error() == QtCore.QLockFile.LockFailedError:
+        return None
+    logger.warning(f'cannot create lock file {Config.lockfile_path}')
+    return lock
+
 
 def make_my_shortcut():
     make_shortcut('liikelaaj', 'run_liikelaaj.py', title='Liikelaajuus')
@@ -82,42 +166,58 @@ class EntryApp(QtWidgets.QMainWindow):
     def __init__(self, check_temp_file=True):
         super().__init__()
         # load user interface made with Qt Designer
-        uifile = resource_filename('liikelaaj', 'tabbed_design.ui')
-        uic.loadUi(uifile, self)
+        uic.loadUi(_UI_FILE, self)
         """
         Explicit tab order needs to be set because Qt does not handle focus correctly
         for custom (compound) widgets (QTBUG-10907). For custom widgets, the focus proxy
-        needs to be explicitly inserted into focus chain. The code in fix_taborder.py can
-        be generated by running:
-        pyuic5.bat tabbed_design.ui | grep TabOrder | sed "s/csb[a-zA-Z0-9]*/&.focusProxy()/g" | sed "s/    MainWindow/self/g" >fix_taborder.py
+        needs to be explicitly inserted into focus chain. The body of fix_taborder() in
+        fix_taborder.py can be generated by running:
+        pyuic5.bat tabbed_design.ui | grep TabOrder | sed "s/csb[a-zA-Z0-9]*/&.focusProxy()/g" | sed "s/ *MainWindow/    self/g"
         (replaces csb* widget names with csb*.focusProxy())
         It should be regenerated whenever new widgets are introduced that are part of the focus chain.
         Before that, define focus chain in Qt Designer.
         """
-        taborder_file = resource_filename('liikelaaj', 'fix_taborder.py')
-        exec(open(taborder_file, "rb").read())
+        fix_taborder(self)
         self.init_widgets()
-        self.data = {}
-        # save empty form (default states for widgets)
-        self.read_forms()
-        self.data_empty = self.data.copy()
-        # whether to save to temp file whenever input widget data changes
-        self.save_to_tmp = True
+        # save empty form (default states for widgets); read-only, so that it
+        # cannot be modified by accident
+        self.data_empty = MappingProxyType(self._read_widgets())
+        self.data = dict(self.data_empty)
+        # (variable, value) pairs of the default state, for quick comparisons
+        self._empty_items = frozenset(self.data_empty.items())
+        # variables that differ from their default values
+        self._modified_keys = set()
+        # cached results of the units and data_with_units properties; reset
+        # by _invalidate_units() whenever the data changes
+        self._units = None
+        self._data_with_units = None
         # whether last save file is up to date with inputs
         self.saved_to_file = True
         # the name of json file where the data was last saved
         self.last_saved_filepath = None
-        # whether to update internal dict of variables on input changes
-        self.update_dict = True
+        # temp file saves are delayed, so that bursts of input changes
+        # (e.g. typing) result in a single write
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(Config.tmpfile_save_delay)
+        self._save_timer.timeout.connect(self._do_save_temp)
+        # data as of last temp file save; used to skip unnecessary saves
+        self._last_saved_temp = None
+        # temp files are written in a separate thread; a single thread is
+        # used, so that the writes are performed in order
+        self._io_pool = QtCore.QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+        # background tasks that have not finished yet
+        self._tasks = set()
+        # the file open dialog; created on first use and then reused
+        self._open_dialog = None
         # load tmp file if it exists
         if Config.tmpfile_path.is_file() and check_temp_file:
             message_dialog(ll_msgs.temp_found)
             self.load_temp()
-        self.text_template = resource_filename('liikelaaj',
-                                               Config.text_template)
-        self.isokin_text_template = resource_filename('liikelaaj',
-                                                      Config.isokin_text_template)
-        self.xls_template = resource_filename('liikelaaj', Config.xls_template)
+        self.text_template = _TEXT_TEMPLATE
+        self.isokin_text_template = _ISOKIN_TEXT_TEMPLATE
+        self.xls_template = _XLS_TEMPLATE
         # TODO: set locale and options if needed
         # loc = QtCore.QLocale()
         # loc.setNumberOptions(loc.OmitGroupSeparator |
@@ -133,159 +233,89 @@ class EntryApp(QtWidgets.QMainWindow):
         convenience methods etc. """
         self.input_widgets = {}
 
-        def spinbox_getval(w):
-            """Return spinbox value"""
-            return w.no_value_text if w.value() == w.minimum() else w.value()
-
-        def spinbox_setval(w, val):
-            """Set spinbox value"""
-            val = w.minimum() if val == w.no_value_text else val
-            w.setValue(val)
-
-        def checkbox_getval(w):
-            """Return yestext or notext for checkbox enabled/disabled,
-            respectively."""
-            val = int(w.checkState())
-            if val == 0:
-                return w.no_text
-            elif val == 2:
-                return w.yes_text
-            else:
-                raise Exception('Unexpected checkbox value')
-
-        def checkbox_setval(w, val):
-            """Set checkbox value to enabled for val == yestext and
-            disabled for val == notext"""
-            if val == w.yes_text:
-                w.setCheckState(2)
-            elif val == w.no_text:
-                w.setCheckState(0)
-            else:
-                raise Exception('Unexpected checkbox entry value')
-
-        def combobox_getval(w):
-            """Get combobox current choice as text"""
-            return w.currentText()
-
-        def combobox_setval(w, val):
-            """Set combobox value according to val (unicode) (must be one of
-            the combobox items)"""
-            idx = w.findText(val)
-            if idx >= 0:
-                w.setCurrentIndex(idx)
-            else:
-                raise ValueError('Tried to set combobox to invalid value.')
-
-        def keyPressEvent_resetOnEsc(obj, event):
-            """Special event handler for spinboxes. Resets value (sets it
-            to minimum) when Esc is pressed."""
-            if event.key() == QtCore.Qt.Key_Escape:
-                obj.setValue(obj.minimum())
-            else:
-                # delegate the event to the overridden superclass handler
-                super(obj.__class__, obj).keyPressEvent(event)
-
-        def isint(x):
-            """ Test for integer """
-            try:
-                int(x)
-                return True
-            except ValueError:
-                return False
-
-        # Change lineEdit to custom one for spinboxes. This cannot be done in
-        # the main widget loop below, because the old QLineEdits get destroyed in
-        # the process (by Qt) and the loop then segfaults while trying to
-        # dereference them (the loop collects all QLineEdits at the start).
-        # Also install special keypress event handler. """
-        for w in self.findChildren((QtWidgets.QSpinBox,
-                                    QtWidgets.QDoubleSpinBox)):
-            wname = w.objectName()
-            if wname[:2] == 'sp':
-                w.setLineEdit(MyLineEdit())
-                w.keyPressEvent = (lambda event, w=w:
-                                   keyPressEvent_resetOnEsc(w, event))
-
-        # CheckDegSpinBoxes get a special LineEdit that catches space
-        # and mouse press events
-        for w in self.findChildren(CheckDegSpinBox):
+        # additional per-type initialization of input widgets
+        def init_spinbox(w):
+            """Spinbox or doublespinbox. The Esc key handling is
+            implemented by the widget classes (EscResetSpinBox etc.)"""
+            # custom lineEdit
+            w.setLineEdit(MyLineEdit())
+            w.no_value_text = Config.spinbox_novalue_text
+
+        def init_checkdegspinbox(w):
+            # special LineEdit that catches space and mouse press events
             w.degSpinBox.setLineEdit(DegLineEdit())
 
-        allwidgets = self.findChildren(QtWidgets.QWidget)
+        extra_inits = {'sp': init_spinbox, 'xb': init_checkbox_texts,
+                       'csb': init_checkdegspinbox}
+
+        # Collect and initialize the input widgets and autowidgets. Qt is
+        # asked for the input widgets only (by name), so the internal
+        # QLineEdits of the spinboxes are not returned; they are destroyed by
+        # Qt when the custom lineEdits are installed, and trying to
+        # dereference them afterwards would segfault. The widget -> varname
+        # translation dict is also set up here.
+        autowidget_names = dict()
+        self.widget_to_var = dict()
+        for w in self.findChildren(QtWidgets.QWidget, INPUT_WIDGET_RE):
+            wname = w.objectName()
+            prefix = widget_prefix(wname)
+            self.input_widgets[wname] = w
+            varname = widget_varname(wname, prefix)
+            self.widget_to_var[wname] = varname
+            # also store the varname in the widget, for quick access
+            w._varname = varname
+            # connect the change signal and set the convenience methods;
+            # w.unit returns the unit for each input (may change dynamically)
+            signal, getval, setval, unit = WIDGET_ACCESSORS[prefix]
+            getattr(w, signal).connect(self._widget_changed)
+            w.getVal = MethodType(getval, w)
+            w.setVal = MethodType(setval, w)
+            w.unit = MethodType(unit, w)
+            if prefix in extra_inits:
+                extra_inits[prefix](w)
+            # TODO: specify whether input value is 'mandatory' or not
+            w.important = False
+            # handle the 'magic' autowidgets with weight normalized data
+            if wname[-4:] == 'Norm':
+                autowidget_names[wname] = w
+
+        # (widget, varname, getter, setter) for each input widget, for quick
+        # iteration over all the inputs; the getters and setters are the
+        # per-type functions, called as getval(w) and setval(w, val)
+        self._widget_ops = widget_ops(self.input_widgets, self.widget_to_var)
 
         def _weight_normalize(w):
-            """Auto calculate callback for weight normalized widgets"""
+            """Auto calculate callback for weight normalized widgets. The
+            widget signals are blocked while setting the value, so that the
+            update does not trigger another values_changed() (and temp file
+            save)."""
             val, weight = (w.getVal() for w in w._autoinputs)
             noval = Config.spinbox_novalue_text
-            w.setVal(noval if val == noval or weight == noval else val/weight)
+            with self._quiet((w,)):
+                w.setVal(noval if val == noval or weight == noval
+                         else val/weight)
 
         # autowidgets are special widgets with automatically computed values
         # they must have ._autocalculate() method which updates the widget
-        # and ._autoinputs list which lists needed input widgets
-        self.autowidgets = list()
+        # and ._autoinputs tuple which lists needed input widgets
+        self.autowidgets = tuple(autowidget_names.values())
         weight_widget = self.spAntropPaino
-        for w in allwidgets:
-            wname = w.objectName()
-            # handle the 'magic' autowidgets with weight normalized data
-            if wname[-4:] == 'Norm':
-                self.autowidgets.append(w)
-                # corresponding unnormalized widget
-                wname_unnorm = wname.replace('Norm', 'NormUn')
-                w_unnorm = self.__dict__[wname_unnorm]
-                w._autoinputs = [w_unnorm, weight_widget]
-                w._autocalculate = lambda w=w: _weight_normalize(w)
-
-        # autowidget values cannot be directly modified
-        for w in self.autowidgets:
+        for wname, w in autowidget_names.items():
+            # corresponding unnormalized widget (also an input widget)
+            wname_unnorm = wname.replace('Norm', 'NormUn')
+            w_unnorm = self.input_widgets[wname_unnorm]
+            w._autoinputs = (w_unnorm, weight_widget)
+            w._autocalculate = MethodType(_weight_normalize, w)
+            # autowidget values cannot be directly modified
             w.setEnabled(False)
 
-        # set various widget convenience methods/properties
-        # input widgets are specially named and will be automatically
-        # collected into a dict
-        for w in allwidgets:
-            wname = w.objectName()
-            wsave = True
-            # w.unit returns the unit for each input (may change dynamically)
-            w.unit = lambda: ''
-            if wname[:2] == 'sp':  # spinbox or doublespinbox
-                # -lambdas need default arguments because of late binding
-                # -lambda expression needs to consume unused 'new value' arg,
-                # therefore two parameters (except for QTextEdit...)
-                w.valueChanged.connect(lambda x, w=w: self.values_changed(w))
-                w.no_value_text = Config.spinbox_novalue_text
-                w.setVal = lambda val, w=w: spinbox_setval(w, val)
-                w.getVal = lambda w=w: spinbox_getval(w)
-                w.unit = lambda w=w: w.suffix() if isint(w.getVal()) else ''
-            elif wname[:2] == 'ln':  # lineedit
-                w.textChanged.connect(lambda x, w=w: self.values_changed(w))
-                w.setVal = w.setText
-                w.getVal = lambda w=w: w.text().strip()
-            elif wname[:2] == 'cb':  # combobox
-                w.currentIndexChanged.connect(lambda x,
-                                              w=w: self.values_changed(w))
-                w.setVal = lambda val, w=w: combobox_setval(w, val)
-                w.getVal = lambda w=w: combobox_getval(w)
-            elif wname[:3] == 'cmt':  # comment text field
-                w.textChanged.connect(lambda w=w: self.values_changed(w))
-                w.setVal = w.setPlainText
-                w.getVal = lambda w=w: w.toPlainText().strip()
-            elif wname[:2] == 'xb':  # checkbox
-                w.stateChanged.connect(lambda x, w=w: self.values_changed(w))
-                w.yes_text = Config.checkbox_yestext
-                w.no_text = Config.checkbox_notext
-                w.setVal = lambda val, w=w: checkbox_setval(w, val)
-                w.getVal = lambda w=w: checkbox_getval(w)
-            elif wname[:3] == 'csb':  # checkdegspinbox
-                w.valueChanged.connect(lambda w=w: self.values_changed(w))
-                w.getVal = w.value
-                w.setVal = w.setValue
-                w.unit = lambda w=w: w.getSuffix() if isint(w.getVal()) else ''
-            else:
-                wsave = False
-            if wsave:
-                self.input_widgets[wname] = w
-                # TODO: specify whether input value is 'mandatory' or not
-                w.important = False
+        # map each input widget to the autowidgets that depend on it
+        autowidget_deps = defaultdict(list)
+        for w in self.autowidgets:
+            for w_input in w._autoinputs:
+                autowidget_deps[w_input].append(w)
+        self._autowidget_deps = {w: tuple(autowidgets) for w, autowidgets
+                                 in autowidget_deps.items()}
 
         self.menuTiedosto.aboutToShow.connect(self._update_menu)
         self.actionTallennaNimella.triggered.connect(self._save_json_dialog)
@@ -319,21 +349,6 @@ class EntryApp(QtWidgets.QMainWindow):
 
         self.statusbar.showMessage(ll_msgs.ready.format(n=self.total_widgets))
 
-        """ Set up widget -> varname translation dict. Variable names
-        are derived by removing 2-3 leading characters (indicating widget type)
-        from widget names (except for comment box variables cmt* which are
-        identical with widget names).
-        """
-        self.widget_to_var = dict()
-        for wname in self.input_widgets:
-            if wname[:3] == 'cmt':
-                varname = wname
-            elif wname[:3] == 'csb':  # custom widget
-                varname = wname[3:]
-            else:
-                varname = wname[2:]
-            self.widget_to_var[wname] = varname
-
         # try to increase font size
         self.setStyleSheet('QWidget { font-size: %dpt;}'
                            % Config.global_fontsize)
@@ -350,23 +365,32 @@ class EntryApp(QtWidgets.QMainWindow):
     def units(self):
         """ Return dict indicating the units for each variable. This may change
         dynamically as the unit may be set to '' for special values. """
-        return {self.widget_to_var[wname]: self.input_widgets[wname].unit()
-                for wname in self.input_widgets}
+        if self._units is None:
+            self._units = {var: w.unit()
+                           for w, var, _, _ in self._widget_ops}
+        return self._units
+
+    def _invalidate_units(self):
+        """ Reset the cached units (and data with units). """
+        self._units = None
+        self._data_with_units = None
 
     @property
     def vars_default(self):
         """ Return a list of variables that are at their default (unmodified)
         state. """
-        return [key for key in self.data if
-                self.data[key] == self.data_empty[key]]
+        return [key for key in self.data if key not in self._modified_keys]
 
     def closeEvent(self, event):
         """ Confirm and close application. """
+        self._flush_temp()
         if not self.saved_to_file:
             reply = confirm_dialog(ll_msgs.quit_not_saved)
         else:
             reply = confirm_dialog(ll_msgs.quit_)
         if reply == QtWidgets.QMessageBox.YesRole:
+            # temp file must not get written after it is removed
+            self._io_pool.waitForDone()
             self.rm_temp()
             event.accept()
         else:
@@ -375,35 +399,53 @@ class EntryApp(QtWidgets.QMainWindow):
     @staticmethod
     def open_help():
         """ Show help. """
+        import webbrowser
         webbrowser.open(Config.help_url)
 
+    def _widget_changed(self, *args):
+        """Slot for the value change signals of all input widgets. The
+        signal arguments (if any) are not needed, since the new value is
+        read from the sending widget."""
+        self.values_changed(self.sender())
+
     def values_changed(self, w):
         """Called whenever widget w value changes"""
-        # find autowidgets that depend on w and update them
-        autowidgets_this = [widget for widget in self.autowidgets if w
-                            in widget._autoinputs]
-        for widget in autowidgets_this:
+        var, val = w._varname, w.getVal()
+        # signals may also fire without an actual change of value
+        if val == self.data[var]:
+            return
+        self._invalidate_units()
+        # update internal data dict
+        self._update_data(var, val)
+        # update autowidgets that depend on w; they do not emit change
+        # signals, so their data is updated here too
+        for widget in self._autowidget_deps.get(w, ()):
             widget._autocalculate()
-        if self.update_dict:  # update internal data dict
-            wname = w.objectName()
-            self.data[self.widget_to_var[wname]] = w.getVal()
+            self._update_data(widget._varname, widget.getVal())
         self.saved_to_file = False
-        if self.save_to_tmp:
-            self.save_temp()
+        self.save_temp()
+
+    def _update_data(self, var, val):
+        """Update a variable in the data dict"""
+        self.data[var] = val
+        if val != self.data_empty[var]:
+            self._modified_keys.add(var)
+        else:
+            self._modified_keys.discard(var)
 
     def load_file(self, path):
         """ Load data from JSON file and restore forms. """
-        with open(path, 'r', encoding='utf-8') as f:
-            data_loaded = json.load(f)
+        data_loaded = _load_json(Path(path).read_bytes())
         keys, loaded_keys = set(self.data), set(data_loaded)
         # warn the user about key mismatch
         if keys != loaded_keys:
             self.keyerror_dialog(keys, loaded_keys)
-        # reset data before load (loaded data might not have all vars)
-        self.data = self.data_empty.copy()
+        # reset data before load (loaded data might not have all vars); the
+        # data dict is updated in place
+        self.data.update(self.data_empty)
         # update values (but exclude unknown keys)
-        for key in keys.intersection(loaded_keys):
-            self.data[key] = data_loaded[key]
+        self.data.update({key: data_loaded[key]
+                          for key in keys & loaded_keys})
         self.restore_forms()
         self.statusbar.showMessage(ll_msgs.status_loaded.format(
                                     filename=str(path), n=self.n_modified()))
@@ -427,13 +469,12 @@ class EntryApp(QtWidgets.QMainWindow):
 
     def save_file(self, path):
         """ Save data into given file in utf-8 encoding. """
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(json.dumps(self.data, ensure_ascii=False,
-                    indent=True, sort_keys=True))
+        _write_json(path, self.data)
 
     def _save_current_file(self):
         if self.last_saved_filepath is None:
             return
+        self._flush_temp()
         self.save_file(self.last_saved_filepath)
         self.saved_to_file = True
         self.statusbar.showMessage(ll_msgs.status_saved +
@@ -441,13 +482,11 @@ class EntryApp(QtWidgets.QMainWindow):
 
     def _load_dialog(self):
         """ Bring up load dialog and load selected file. """
+        # back up any pending input changes before the data gets replaced
+        self._flush_temp()
         if self.saved_to_file or confirm_dialog(ll_msgs.load_not_saved):
-            fout = QtWidgets.QFileDialog.getOpenFileName(self,
-                                                         ll_msgs.open_title,
-                                                         str(Config.data_root_path),
-                                                         Config.json_filter)
-            path = Path(fout[0])
-            if not path.is_file():
+            path = self._open_file_dialog()
+            if path is None or not path.is_file():
                 return
             try:
                 self.load_file(path)
@@ -461,29 +500,52 @@ class EntryApp(QtWidgets.QMainWindow):
     @property
     def data_with_units(self):
         """Append units to values"""
-        return {key: '%s%s' % (self.data[key], self.units[key]) for key in
-                self.data}
-
-    def make_txt_report(self, template, include_units=True):
-        """Create text report from current data"""
+        if self._data_with_units is None:
+            units = self.units
+            self._data_with_units = {key: f'{val}{units[key]}'
+                                     for key, val in self.data.items()}
+        return self._data_with_units
+
+    def _report(self, include_units=True):
+        """Create a Report instance from current data. The instance holds
+        copies of the data, so it can be used from other threads."""
+        # the reporter module (and the Excel libraries it uses) is imported
+        # only when needed, to speed up startup
+        from . import reporter
         # uncomment to respond to template changes while running
         # importlib.reload(reporter)
         data = self.data_with_units if include_units else self.data
-        rep = reporter.Report(data, self.vars_default)
-        return rep.make_report(template)
+        return reporter.Report(data, self.vars_default)
+
+    def make_txt_report(self, template, include_units=True):
+        """Create text report from current data"""
+        return self._report(include_units).make_report(template)
 
     def make_excel_report(self, xls_template):
         """Create Excel report from current data"""
-        rep = reporter.Report(self.data, self.vars_default)
-        return rep.make_excel(xls_template)
+        return self._report(include_units=False).make_excel(xls_template)
+
+    def _make_report_in_background(self, make_report, on_finished):
+        """Run report creation function make_report in a worker thread, then
+        call on_finished with the report. Report actions are disabled
+        meanwhile."""
+        report_actions = [self.actionTekstiraportti,
+                          self.actionTekstiraportti_isokineettinen,
+                          self.actionExcel_raportti]
+        run_with_disabled_actions(self._tasks, report_actions, make_report,
+                                  on_finished)
 
     def _save_default_text_report_dialog(self):
         """Create text report and open dialog for saving it"""
-        txt = self.make_txt_report(self.text_template)
-        self._save_text_report_dialog(txt, Config.text_report_prefix)
+        rep, template = self._report(), self.text_template
+        self._make_report_in_background(
+            lambda: rep.make_report(template),
+            lambda txt: self._save_text_report_dialog(
+                txt, Config.text_report_prefix))
 
     def _save_json_dialog(self):
         """ Bring up save dialog and save data. """
+        self._flush_temp()
         # special ops for certain widgets
         hetu = self.lnTiedotHetu.getVal()
         if hetu and not check_hetu(hetu):
@@ -502,17 +564,39 @@ class EntryApp(QtWidgets.QMainWindow):
 
     def _save_isokin_text_report_dialog(self):
         """Create isokinetic text report and open dialog for saving it"""
-        txt = self.make_txt_report(self.isokin_text_template,
-                                   include_units=False)
-        self._save_text_report_dialog(txt, Config.isokin_text_report_prefix)
+        rep = self._report(include_units=False)
+        template = self.isokin_text_template
+        self._make_report_in_background(
+            lambda: rep.make_report(template),
+            lambda txt: self._save_text_report_dialog(
+                txt, Config.isokin_text_report_prefix))
 
     def _save_default_excel_report_dialog(self):
         """Create Excel report and open dialog for saving it"""
-        wb = self.make_excel_report(self.xls_template)
-        self._save_excel_report_dialog(wb)
+        rep, template = self._report(include_units=False), self.xls_template
+        self._make_report_in_background(lambda: rep.make_excel(template),
+                                        self._save_excel_report_dialog)
+
+    def _open_file_dialog(self):
+        """Run the JSON file open dialog. Returns the selected path, or None
+        if the dialog was cancelled. The dialog is created on first use and
+        then reused, so that it stays in the last used directory instead of
+        starting over from Config.data_root_path."""
+        dlg = self._open_dialog
+        if dlg is None:
+            dlg = self._open_dialog = QtWidgets.QFileDialog(
+                self, ll_msgs.open_title, str(Config.data_root_path),
+                Config.json_filter)
+            dlg.setAcceptMode(QtWidgets.QFileDialog.AcceptOpen)
+            dlg.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+        files = dlg.selectedFiles() if dlg.exec_() else []
+        return Path(files[0]) if files else None
 
     def _save_dialog(self, destpath, file_filter):
-        """Save dialog for suggested filename destpath and filter file_filter"""
+        """Save dialog for suggested filename destpath and filter
+        file_filter. A new dialog is used for every save, so that the
+        previously saved file (possibly of another patient) is not
+        suggested as the target."""
         fout = QtWidgets.QFileDialog.getSaveFileName(self, ll_msgs.save_title,
                                                      str(destpath),
                                                      file_filter)
@@ -551,8 +635,7 @@ class EntryApp(QtWidgets.QMainWindow):
 
     def n_modified(self):
         """ Count modified values. """
-        return len([x for x in self.data if
-                    self.data[x] != self.data_empty[x]])
+        return len(self._modified_keys)
 
     def page_change(self):
         """Callback for tab change"""
@@ -565,12 +648,39 @@ class EntryApp(QtWidgets.QMainWindow):
                 widget.setFocus()
 
     def save_temp(self):
-        """ Save form input data into temporary backup file. Exceptions will be
-        caught by the fatal exception mechanism. """
-        self.save_file(Config.tmpfile_path)
+        """ Schedule a save into the temporary backup file. The save timer is
+        restarted on every call, so that the actual save happens only when
+        the inputs have not changed for a while. """
+        self._save_timer.start()
+
+    def _flush_temp(self):
+        """ Perform any pending temp file save immediately. """
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_save_temp()
+
+    def _do_save_temp(self):
+        """ Save form input data into temporary backup file. Nothing is
+        written if the data has not changed since the last save. The file is
+        written in a worker thread, from a copy of the data. Exceptions
+        will be caught by the fatal exception mechanism. """
+        if self.data == self._last_saved_temp:
+            return
+        data = self.data.copy()
+        self._last_saved_temp = data
         msg = ll_msgs.status_value_change.format(n=self.n_modified(),
                                                  tmpfile=str(Config.tmpfile_path))
-        self.statusbar.showMessage(msg)
+        run_in_background(self._tasks, lambda: self._write_temp(data),
+                          lambda _: self.statusbar.showMessage(msg),
+                          pool=self._io_pool)
+
+    @staticmethod
+    def _write_temp(data):
+        """ Write the temp file with given data. The file is replaced
+        atomically, so that a crash during the write does not destroy the
+        previous backup. Called in the IO thread. """
+        # the temp file is not meant for humans, so it is written compactly
+        _write_json(Config.tmpfile_path, data, pretty=False)
 
     def load_temp(self):
         """ Load form input data from temporary backup file. """
@@ -578,45 +688,79 @@ class EntryApp(QtWidgets.QMainWindow):
             self.load_file(Config.tmpfile_path)
         except Config.json_io_exceptions:
             message_dialog(ll_msgs.cannot_open_tmp)
-
-    @staticmethod
-    def rm_temp():
-        """ Remove temp file.  """
+        else:
+            # the restored data has not been saved by the user; the forms are
+            # restored with signals blocked, so values_changed() did not
+            # reset the flag
+            self.saved_to_file = False
+
+    def rm_temp(self):
+        """ Remove temp file. Any pending temp file writes must be finished
+        before calling this. """
         if Config.tmpfile_path.is_file():
             os.remove(Config.tmpfile_path)
 
     def _clear_forms_dialog(self):
         """ Ask whether to clear forms. If yes, set widget inputs to default
         values. """
+        # back up any pending input changes before the data gets cleared
+        self._flush_temp()
         if self.saved_to_file:
             reply = confirm_dialog(ll_msgs.clear)
         else:
             reply = confirm_dialog(ll_msgs.clear_not_saved)
         if reply == QtWidgets.QMessageBox.YesRole:
-            self.data = self.data_empty.copy()
+            self.data.update(self.data_empty)
             self.restore_forms()
             self.statusbar.showMessage(ll_msgs.status_cleared)
             self.last_saved_filepath = None
             self.saved_to_file = True  # empty data assumed 'saved'
 
+    @contextmanager
+    def _quiet(self, widgets=None):
+        """Context manager that blocks the signals of given widgets (default
+        all input widgets), so that programmatic value changes do not
+        trigger values_changed()"""
+        if widgets is None:
+            widgets = self.input_widgets.values()
+        blockers = [QtCore.QSignalBlocker(w) for w in widgets]
+        try:
+            yield
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+
     def restore_forms(self):
-        """ Restore widget input values from self.data. Need to disable widget
-        callbacks and automatic data saving while programmatic updating of
-        widgets is taking place. """
-        self.save_to_tmp = False
-        self.update_dict = False
-        for wname in self.input_widgets:
-            self.input_widgets[wname].setVal(self.data[
-                                             self.widget_to_var[wname]])
-        self.save_to_tmp = True
-        self.update_dict = True
+        """ Restore widget input values from self.data. Widgets that already
+        have the correct value are not touched. Widget signals are blocked
+        while programmatic updating of widgets is taking place, so the
+        autowidgets need to be updated explicitly. """
+        with self._quiet():
+            data = self.data
+            for w, var, getval, setval in self._widget_ops:
+                val = data[var]
+                if getval(w) != val:
+                    setval(w, val)
+            for w in self.autowidgets:
+                w._autocalculate()
+        self._invalidate_units()
+        self._update_modified_keys()
+
+    def _update_modified_keys(self):
+        """ Recompute the set of modified variables from scratch. """
+        self._modified_keys = {key for key, val in self.data.items()
+                               if (key, val) not in self._empty_items}
+
+    def _read_widgets(self):
+        """ Return the widget input values as a dict. """
+        return {var: getval(w) for w, var, getval, _ in self._widget_ops}
 
     def read_forms(self):
         """ Read self.data from widget inputs. Usually not needed, since
         it's updated automatically. """
-        for wname in self.input_widgets:
-            var = self.widget_to_var[wname]
-            self.data[var] = self.input_widgets[wname].getVal()
+        self.data.update(self._read_widgets())
+        self._invalidate_units()
+        self._update_modified_keys()
 
 
 def main():
@@ -632,9 +776,11 @@ def main():
         sys.stdout = sys.stderr = blackhole
 
     app = QtWidgets.QApplication(sys.argv)
-    if not Config.allow_multiple_instances and already_running('liikelaaj'):
-        message_dialog(ll_msgs.already_running)
-        return
+    if not Config.allow_multiple_instances:
+        instance_lock = _lock_instance()
+        if instance_lock is None:
+            message_dialog(ll_msgs.already_running)
+            return
 
     eapp = EntryApp()
 
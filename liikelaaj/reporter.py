@@ -7,12 +7,21 @@ Create reports for liikelaajuus
 """
 
 import string
+from functools import lru_cache
 from xlrd import open_workbook
 from xlutils.copy import copy
 
 from .config import Config
 
 
+@lru_cache(maxsize=None)
+def _compile_template(fn_template):
+    """ Read and compile a text report template. The code objects are cached,
+    so the template is only read once per run. """
+    with open(fn_template, 'rb') as f:
+        return compile(f.read(), fn_template, 'exec')
+
+
 """ Next 2 xlrd hacks copied from:
 http://stackoverflow.com/questions/3723793/
 preserving-styles-using-pythons-xlrd-xlwt-and-xlutils-copy?lq=1 """
@@ -115,8 +124,7 @@ class Report(object):
         # the recommended Python 3 alternative to execfile()
         # exec() arguments for globals and locals are a bit tricky. this form
         # allows us to read in the function local namespace and modify it
-        exec(compile(open(fn_template, "rb").read(), fn_template, 'exec'),
-             ldict, ldict)
+        exec(_compile_template(fn_template), ldict, ldict)
         return ldict['report'].text
 
     def make_excel(self, fn_template):
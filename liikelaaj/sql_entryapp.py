@@ -39,6 +39,9 @@ data differs from the original JSON format, which preservers float values.
 
 import sys
 import json
+import functools
+from types import MappingProxyType, MethodType
+from collections import defaultdict
 from pathlib import Path
 import datetime
 from PyQt5.QtSql import QSqlQuery
@@ -46,20 +49,41 @@ import sip
 from PyQt5 import uic, QtCore, QtWidgets
 import webbrowser
 import logging
-from pkg_resources import resource_filename
+
+try:
+    from importlib.resources import files
+except ImportError:  # Python < 3.9
+    from pkg_resources import resource_filename
+
+    def files(package):
+        """Fallback for importlib.resources.files()"""
+        return Path(resource_filename(package, ''))
 
 
 from .config import Config
 from .widgets import (
     MyLineEdit,
     DegLineEdit,
-    CheckDegSpinBox,
     message_dialog,
+    run_with_disabled_actions,
+    INPUT_WIDGET_RE,
+    widget_prefix,
+    widget_varname,
+    init_checkbox_texts,
+    widget_ops,
+    WIDGET_ACCESSORS,
 )
 from . import reporter, ll_msgs
 
 logger = logging.getLogger(__name__)
 
+# package resources; resolved once at import time
+_PKG_PATH = files('liikelaaj')
+_UI_FILE = str(_PKG_PATH / 'tabbed_design_sql.ui')
+_TEXT_TEMPLATE = str(_PKG_PATH / Config.text_template)
+_ISOKIN_TEXT_TEMPLATE = str(_PKG_PATH / Config.isokin_text_template)
+_XLS_TEMPLATE = str(_PKG_PATH / Config.xls_template)
+
 
 def debug_print(msg):
     print(msg)
@@ -83,43 +107,82 @@ def pyqt_disable_autoconv(func):
     return wrapper
 
 
+@functools.lru_cache(maxsize=128)
+def _update_sql(vars):
+    """Return the SQL statement for updating a tuple of variables of a ROM.
+
+    The statements are cached, since the same sets of variables tend to get
+    updated repeatedly. Positional placeholders are used; the values are
+    bound in the order of vars, followed by the ROM id.
+    """
+    varlist = ','.join(f'{var} = ?' for var in vars)
+    return f'UPDATE roms SET {varlist} WHERE rom_id = ?'
+
+
+@functools.lru_cache(maxsize=16)
+def _select_sql(vars):
+    """Return the SQL statement for selecting a tuple of variables of a ROM"""
+    varlist = ','.join(vars)
+    return f'SELECT {varlist} FROM roms WHERE rom_id = ?'
+
+
 class EntryApp(QtWidgets.QMainWindow):
-    """Data entry window"""
+    """Data entry window.
+
+    database is an open QSqlDatabase connection. NOTE: for SQLite, some
+    connection options (PRAGMAs) are changed for faster writes (see
+    _set_pragmas). The connection is not owned by this class, so the changes
+    also apply to any other users of the same connection.
+    """
 
     closing = QtCore.pyqtSignal(object)
 
     def __init__(self, database, rom_id, newly_created=None):
         super().__init__()
         # load user interface made with Qt Designer
-        uifile = resource_filename('liikelaaj', 'tabbed_design_sql.ui')
-        uic.loadUi(uifile, self)
+        uic.loadUi(_UI_FILE, self)
         """
         Explicit tab order needs to be set because Qt does not handle focus correctly
         for custom (compound) widgets (QTBUG-10907). For custom widgets, the focus proxy
-        needs to be explicitly inserted into focus chain. The code in fix_taborder.py can
-        be generated by running:
-        pyuic5.bat tabbed_design.ui | grep TabOrder | sed "s/csb[a-zA-Z0-9]*/&.focusProxy()/g" | sed "s/    MainWindow/self/g" >fix_taborder.py
+        needs to be explicitly inserted into focus chain. The body of fix_taborder() in
+        fix_taborder.py can be generated by running:
+        pyuic5.bat tabbed_design.ui | grep TabOrder | sed "s/csb[a-zA-Z0-9]*/&.focusProxy()/g" | sed "s/ *MainWindow/    self/g"
         (replaces csb* widget names with csb*.focusProxy())
         It should be regenerated whenever new widgets are introduced that are part of the focus chain.
         Before that, define focus chain in Qt Designer.
         """
-        # taborder_file = resource_filename('liikelaaj', 'fix_taborder.py')
-        # exec(open(taborder_file, "rb").read())
+        # from .fix_taborder import fix_taborder
+        # fix_taborder(self)
         self.confirm_close = True  # used to implement force close
         self.init_widgets()
-        self.data = {}
-        self.read_forms()  # read default data from widgets
-        self.data_empty = self.data.copy()
-        # whether to update internal dict of variables on input changes
-        self.update_dict = True
-        self.text_template = resource_filename('liikelaaj', Config.text_template)
-        self.isokin_text_template = resource_filename(
-            'liikelaaj', Config.isokin_text_template
-        )
-        self.xls_template = resource_filename('liikelaaj', Config.xls_template)
+        # cached results of the units and data_with_units properties; reset
+        # by _invalidate_units() whenever the data changes
+        self._units = None
+        self._data_with_units = None
+        # read default data from widgets; read-only view of the default values
+        self.data_empty = MappingProxyType(self._read_widgets())
+        self.data = dict(self.data_empty)
+        # keep track of the variables that differ from defaults
+        self._modified_keys = set()
+        # the variables in fixed order, for database reads
+        self._vars = tuple(self.data)
+        # Changed values that have not been written into the database yet.
+        # Database updates are delayed, so that bursts of input changes
+        # (e.g. spinbox arrow keys) result in a single write.
+        self._dirty = dict()
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(Config.db_update_delay)
+        self._update_timer.timeout.connect(self._flush_updates)
+        # references to running background tasks
+        self._tasks = set()
+        self.text_template = _TEXT_TEMPLATE
+        self.isokin_text_template = _ISOKIN_TEXT_TEMPLATE
+        self.xls_template = _XLS_TEMPLATE
         self.database = database
         self.rom_id = rom_id
         self.newly_created = newly_created
+        self._set_pragmas()
         # the read only fields are uneditable, they reside in the patients table
         self.init_readonly_fields()
         if newly_created:
@@ -149,6 +212,27 @@ class EntryApp(QtWidgets.QMainWindow):
         else:
             message_dialog(msg)
 
+    def _set_pragmas(self):
+        """Set SQLite connection options for faster writes.
+
+        The options are set on the shared connection (self.database), so they
+        stay in effect for the host application, also after this window is
+        closed. temp_store and cache_size only affect memory use. The journal
+        mode is not changed here, since the database may be shared over a
+        network drive, where WAL mode does not work. If the database is already
+        in WAL mode, relaxed synchronization is safe and is enabled.
+        """
+        if self.database.driverName() != 'QSQLITE':
+            return
+        q = QSqlQuery(self.database)
+        if q.exec('PRAGMA journal_mode') and q.first():
+            if str(q.value(0)).lower() == 'wal':
+                q.exec('PRAGMA synchronous = NORMAL')
+        q.exec('PRAGMA temp_store = MEMORY')
+        q.exec('PRAGMA cache_size = -20000')
+        # release any locks
+        q.finish()
+
     @pyqt_disable_autoconv
     def select(self, vars):
         """Perform select on current ROM row to get data.
@@ -157,9 +241,8 @@ class EntryApp(QtWidgets.QMainWindow):
         Use QVariant().value() to get the values.
         """
         q = QSqlQuery(self.database)
-        varlist = ','.join(vars)
-        q.prepare(f'SELECT {varlist} FROM roms WHERE rom_id = :rom_id')
-        q.bindValue(':rom_id', self.rom_id)
+        q.prepare(_select_sql(tuple(vars)))
+        q.addBindValue(self.rom_id)
         if not q.exec() or not q.first():
             self.db_failure(q, fatal=True)
         results = tuple(q.value(k) for k in range(len(vars)))
@@ -170,36 +253,62 @@ class EntryApp(QtWidgets.QMainWindow):
         if not len(vars) == len(values):
             raise ValueError('Arguments need to be of equal length')
         q = QSqlQuery(self.database)
-        varlist = ','.join(f'{var} = :{var}' for var in vars)
-        q.prepare(f'UPDATE roms SET {varlist} WHERE rom_id = :rom_id')
-        q.bindValue(':rom_id', self.rom_id)
+        q.prepare(_update_sql(tuple(vars)))
         # XXX: note that we don't do any type conversion here. For a given
         # variable, the type of the value might change from one write to another
         # (i.e. from string "Ei mitattu" to float 5.0). This works with SQLite,
         # since it uses dynamic typing. For any other database engine, it will
         # be necessary to convert the values on read/write, so that static types
         # are maintained.
-        for var, val in zip(vars, values):
-            q.bindValue(f':{var}', val)
+        for val in values:
+            q.addBindValue(val)
+        q.addBindValue(self.rom_id)
         if not q.exec():
             # it's possible that locking failures may occur, so make them non-fatal
             self.db_failure(q, fatal=False)
+            return False
+        return True
+
+    def _flush_updates(self):
+        """Write pending variable updates into the database"""
+        self._update_timer.stop()
+        if not self._dirty:
+            return
+        # sort by variable name, so that the same sets of variables map to
+        # the same (cached) SQL statement
+        vars, values = zip(*sorted(self._dirty.items()))
+        # write in an explicit transaction, so that the commit boundary does not
+        # depend on the driver; transaction() fails if not supported, in which
+        # case the driver autocommits
+        in_transaction = self.database.transaction()
+        # on failure, the values are kept and written on the next update
+        if self.update_rom(vars, values):
+            if not in_transaction or self.database.commit():
+                self._dirty.clear()
+                return
+            logger.warning(
+                f'commit failed: {self.database.lastError().databaseText()}'
+            )
+        if in_transaction:
+            self.database.rollback()
 
     def init_readonly_fields(self):
         """Fill the read-only patient info widgets"""
-        patient_id = self.select(['patient_id'])[0].value()
         q = QSqlQuery(self.database)
         vars = ['firstname', 'lastname', 'ssn', 'patient_code', 'diagnosis']
-        varlist = ','.join(vars)
-        q.prepare(f'SELECT {varlist} FROM patients WHERE patient_id = :patient_id')
-        q.bindValue(':patient_id', patient_id)
+        widgets = [getattr(self, f'rdonly_{var}') for var in vars]
+        varlist = ','.join(f'patients.{var}' for var in vars)
+        # get the patient data of the ROM using a single query
+        q.prepare(
+            f'SELECT {varlist} FROM roms JOIN patients '
+            'ON roms.patient_id = patients.patient_id WHERE roms.rom_id = :rom_id'
+        )
+        q.bindValue(':rom_id', self.rom_id)
         if not q.exec() or not q.first():
-            self.db_failure(fatal=True)
-        for k, var in enumerate(vars):
-            val = q.value(k)
-            widget_name = 'rdonly_' + var
-            self.__dict__[widget_name].setText(val)
-            self.__dict__[widget_name].setEnabled(False)
+            self.db_failure(q, fatal=True)
+        for k, widget in enumerate(widgets):
+            widget.setText(q.value(k))
+            widget.setEnabled(False)
 
     def get_patient_id_data(self):
         """Get patient id data from the read-only fields as a dict.
@@ -224,171 +333,108 @@ class EntryApp(QtWidgets.QMainWindow):
             self.values_changed(source)
         return super().eventFilter(source, event)
 
+    # Type specific widget initialization, called from init_widgets().
+    # Lambdas need default arguments because of late binding. The lambda
+    # expressions need to consume the unused 'new value' arg, therefore
+    # two parameters (except for CheckDegSpinBox).
+
+    def _init_spinbox(self, w):
+        """Initialize a spinbox or doublespinbox"""
+        # custom lineEdit; the Esc key handling is implemented by the spinbox
+        # classes
+        w.setLineEdit(MyLineEdit())
+        w.valueChanged.connect(lambda x, w=w: self.values_changed(w))
+        w.no_value_text = Config.spinbox_novalue_text
+
+    def _init_editor(self, w):
+        """Initialize a lineedit or comment text field"""
+        # for text editors, do not perform data updates on every value change;
+        # instead, update values when focus is lost (editing completed)
+        w.installEventFilter(self)
+
+    def _init_combobox(self, w):
+        """Initialize a combobox"""
+        w.currentIndexChanged.connect(lambda x, w=w: self.values_changed(w))
+
+    def _init_checkbox(self, w):
+        """Initialize a checkbox"""
+        w.stateChanged.connect(lambda x, w=w: self.values_changed(w))
+        init_checkbox_texts(w)
+
+    def _init_checkdegspinbox(self, w):
+        """Initialize a CheckDegSpinBox"""
+        # special LineEdit that catches space and mouse press events
+        w.degSpinBox.setLineEdit(DegLineEdit())
+        w.valueChanged.connect(lambda w=w: self.values_changed(w))
+
     def init_widgets(self):
         """Make a dict of our input widgets and install some callbacks and
         convenience methods etc."""
         self.input_widgets = {}
 
-        def spinbox_getval(w):
-            """Return spinbox value"""
-            return w.no_value_text if w.value() == w.minimum() else w.value()
-
-        def spinbox_setval(w, val):
-            """Set spinbox value"""
-            val = w.minimum() if val == w.no_value_text else val
-            w.setValue(val)
-
-        def checkbox_getval(w):
-            """Return yestext or notext for checkbox enabled/disabled,
-            respectively."""
-            val = int(w.checkState())
-            if val == 0:
-                return w.no_text
-            elif val == 2:
-                return w.yes_text
-            else:
-                raise RuntimeError(
-                    f'Unexpected checkbox value: {val} for {w.objectName()}'
-                )
-
-        def checkbox_setval(w, val):
-            """Set checkbox value to enabled for val == yestext and
-            disabled for val == notext"""
-            if val == w.yes_text:
-                w.setCheckState(2)
-            elif val == w.no_text:
-                w.setCheckState(0)
-            else:
-                raise RuntimeError(
-                    f'Unexpected checkbox entry value: {val} for {w.objectName()}'
-                )
-
-        def combobox_getval(w):
-            """Get combobox current choice as text"""
-            return w.currentText()
-
-        def combobox_setval(w, val):
-            """Set combobox value according to val (unicode) (must be one of
-            the combobox items)"""
-            idx = w.findText(val)
-            if idx >= 0:
-                w.setCurrentIndex(idx)
-            else:
-                raise ValueError(f'Tried to set combobox to invalid value {val}')
-
-        def keyPressEvent_resetOnEsc(obj, event):
-            """Special event handler for spinboxes. Resets value (sets it
-            to minimum) when Esc is pressed."""
-            if event.key() == QtCore.Qt.Key_Escape:
-                obj.setValue(obj.minimum())
-            else:
-                # delegate the event to the overridden superclass handler
-                super(obj.__class__, obj).keyPressEvent(event)
-
-        def isint(x):
-            """Test for integer"""
-            try:
-                int(x)
-                return True
-            except ValueError:
-                return False
-
-        # Change lineEdit to custom one for spinboxes. This cannot be done in
-        # the main widget loop below, because the old QLineEdits get destroyed in
-        # the process (by Qt) and the loop then segfaults while trying to
-        # dereference them (the loop collects all QLineEdits at the start).
-        # Also install special keypress event handler. """
-        for w in self.findChildren((QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
-            wname = w.objectName()
-            if wname[:2] == 'sp':
-                w.setLineEdit(MyLineEdit())
-                w.keyPressEvent = lambda event, w=w: keyPressEvent_resetOnEsc(w, event)
-
-        # CheckDegSpinBoxes get a special LineEdit that catches space
-        # and mouse press events
-        for w in self.findChildren(CheckDegSpinBox):
-            w.degSpinBox.setLineEdit(DegLineEdit())
-
-        allwidgets = self.findChildren(QtWidgets.QWidget)
-
         def _weight_normalize(w):
             """Auto calculate callback for weight normalized widgets"""
             val, weight = (w.getVal() for w in w._autoinputs)
             noval = Config.spinbox_novalue_text
             w.setVal(noval if val == noval or weight == noval else val / weight)
 
+        # Collect the input widgets and set various widget convenience
+        # methods/properties, in a single pass. Qt is asked for the input
+        # widgets only (by name), so the internal QLineEdits of the spinboxes
+        # are not returned; they get destroyed by Qt when the custom lineEdits
+        # are installed, and trying to dereference them afterwards would
+        # segfault. The widget -> varname translation dict is also set up
+        # here.
+        self.widget_to_var = dict()
+        autowidget_names = list()
+        init_handlers = {
+            'sp': self._init_spinbox,
+            'ln': self._init_editor,
+            'cb': self._init_combobox,
+            'cmt': self._init_editor,
+            'xb': self._init_checkbox,
+            'csb': self._init_checkdegspinbox,
+        }
+        for w in self.findChildren(QtWidgets.QWidget, INPUT_WIDGET_RE):
+            wname = w.objectName()
+            prefix = widget_prefix(wname)
+            # set the getter, setter and unit methods; w.unit returns the unit
+            # for each input (may change dynamically)
+            _, getval, setval, unit = WIDGET_ACCESSORS[prefix]
+            w.getVal = MethodType(getval, w)
+            w.setVal = MethodType(setval, w)
+            w.unit = MethodType(unit, w)
+            # type specific setup
+            init_handlers[prefix](w)
+            self.input_widgets[wname] = w
+            self.widget_to_var[wname] = widget_varname(wname, prefix)
+            # TODO: specify whether input value is 'mandatory' or not
+            w.important = False
+            # the 'magic' autowidgets with weight normalized data
+            if wname[-4:] == 'Norm':
+                autowidget_names.append(wname)
+
         # Autowidgets are special widgets with automatically computed values.
         # They must have an ._autocalculate() method which updates the widget
         # and ._autoinputs list which lists the necessary input widgets.
         self.autowidgets = list()
         weight_widget = self.spAntropPaino
-        for w in allwidgets:
-            wname = w.objectName()
-            # handle the 'magic' autowidgets with weight normalized data
-            if wname[-4:] == 'Norm':
-                self.autowidgets.append(w)
-                # corresponding unnormalized widget
-                wname_unnorm = wname.replace('Norm', 'NormUn')
-                w_unnorm = self.__dict__[wname_unnorm]
-                w._autoinputs = [w_unnorm, weight_widget]
-                w._autocalculate = lambda w=w: _weight_normalize(w)
-
-        # autowidget values cannot be directly modified
-        for w in self.autowidgets:
+        for wname in autowidget_names:
+            w = self.input_widgets[wname]
+            self.autowidgets.append(w)
+            # corresponding unnormalized widget
+            wname_unnorm = wname.replace('Norm', 'NormUn')
+            w_unnorm = self.input_widgets[wname_unnorm]
+            w._autoinputs = [w_unnorm, weight_widget]
+            w._autocalculate = lambda w=w: _weight_normalize(w)
+            # autowidget values cannot be directly modified
             w.setEnabled(False)
 
-        # set various widget convenience methods/properties
-        # input widgets are specially named and will be automatically
-        # collected into a dict
-        for w in allwidgets:
-            wname = w.objectName()
-            wsave = True
-            # w.unit returns the unit for each input (may change dynamically)
-            w.unit = lambda: ''
-            if wname[:2] == 'sp':  # spinbox or doublespinbox
-                # -lambdas need default arguments because of late binding
-                # -lambda expression needs to consume unused 'new value' arg,
-                # therefore two parameters (except for QTextEdit...)
-                w.valueChanged.connect(lambda x, w=w: self.values_changed(w))
-                w.no_value_text = Config.spinbox_novalue_text
-                w.setVal = lambda val, w=w: spinbox_setval(w, val)
-                w.getVal = lambda w=w: spinbox_getval(w)
-                w.unit = lambda w=w: w.suffix() if isint(w.getVal()) else ''
-            elif wname[:2] == 'ln':  # lineedit
-                # for text editors, do not perform data updates on every value change...
-                # w.textChanged.connect(lambda x, w=w: self.values_changed(w))
-                w.setVal = w.setText
-                w.getVal = lambda w=w: w.text().strip()
-                # instead, update values when focus is lost (editing completed)
-                w.installEventFilter(self)
-            elif wname[:2] == 'cb':  # combobox
-                w.currentIndexChanged.connect(lambda x, w=w: self.values_changed(w))
-                w.setVal = lambda val, w=w: combobox_setval(w, val)
-                w.getVal = lambda w=w: combobox_getval(w)
-            elif wname[:3] == 'cmt':  # comment text field
-                # for text editors, do not perform data updates on every value change...
-                # w.textChanged.connect(lambda w=w: self.values_changed(w))
-                w.setVal = w.setPlainText
-                w.getVal = lambda w=w: w.toPlainText().strip()
-                # instead, update values when focus is lost (editing completed)
-                w.installEventFilter(self)
-            elif wname[:2] == 'xb':  # checkbox
-                w.stateChanged.connect(lambda x, w=w: self.values_changed(w))
-                w.yes_text = Config.checkbox_yestext
-                w.no_text = Config.checkbox_notext
-                w.setVal = lambda val, w=w: checkbox_setval(w, val)
-                w.getVal = lambda w=w: checkbox_getval(w)
-            elif wname[:3] == 'csb':  # checkdegspinbox
-                w.valueChanged.connect(lambda w=w: self.values_changed(w))
-                w.getVal = w.value
-                w.setVal = w.setValue
-                w.unit = lambda w=w: w.getSuffix() if isint(w.getVal()) else ''
-            else:
-                wsave = False
-            if wsave:
-                self.input_widgets[wname] = w
-                # TODO: specify whether input value is 'mandatory' or not
-                w.important = False
+        # map each input widget to the autowidgets that depend on it
+        self._autowidget_deps = defaultdict(list)
+        for w in self.autowidgets:
+            for w_input in w._autoinputs:
+                self._autowidget_deps[w_input].append(w)
 
         # slot called on tab change
         self.maintab.currentChanged.connect(self.page_change)
@@ -411,20 +457,9 @@ class EntryApp(QtWidgets.QMainWindow):
 
         self.statusbar.showMessage(ll_msgs.ready.format(n=self.total_widgets))
 
-        """ Set up widget -> varname translation dict. Variable names
-        are derived by removing 2-3 leading characters (indicating widget type)
-        from widget names (except for comment box variables cmt* which are
-        identical with widget names).
-        """
-        self.widget_to_var = dict()
-        for wname in self.input_widgets:
-            if wname[:3] == 'cmt':
-                varname = wname
-            elif wname[:3] == 'csb':  # custom widget
-                varname = wname[3:]
-            else:
-                varname = wname[2:]
-            self.widget_to_var[wname] = varname
+        # (widget, varname, getter, setter) for each input widget, for quick
+        # iteration; the getters and setters are the per-type functions
+        self._widget_ops = widget_ops(self.input_widgets, self.widget_to_var)
 
         # try to increase font size
         self.setStyleSheet('QWidget { font-size: %dpt;}' % Config.global_fontsize)
@@ -435,16 +470,23 @@ class EntryApp(QtWidgets.QMainWindow):
     def units(self):
         """Return dict indicating the units for each variable. This may change
         dynamically as the unit may be set to '' for special values."""
-        return {
-            self.widget_to_var[wname]: self.input_widgets[wname].unit()
-            for wname in self.input_widgets
-        }
+        if self._units is None:
+            self._units = {
+                self.widget_to_var[wname]: w.unit()
+                for wname, w in self.input_widgets.items()
+            }
+        return self._units
+
+    def _invalidate_units(self):
+        """Reset the cached units (and data with units)."""
+        self._units = None
+        self._data_with_units = None
 
     @property
     def vars_default(self):
         """Return a list of variables that are at their default (unmodified)
         state."""
-        return [key for key in self.data if self.data[key] == self.data_empty[key]]
+        return [key for key in self.data if key not in self._modified_keys]
 
     def do_close(self, event):
         """The actual closing ritual"""
@@ -468,6 +510,7 @@ class EntryApp(QtWidgets.QMainWindow):
         # Since some widgets update only when losing focus, we want to make sure
         # they lose focus before closing the app, so that data is updated.
         self.setFocus()
+        self._flush_updates()
         if not self.confirm_close:  # force close
             self.do_close(event)
         else:  # closing via ui
@@ -504,20 +547,35 @@ class EntryApp(QtWidgets.QMainWindow):
 
         This does several things, most importantly updates the database.
         """
-        # find autowidgets that depend on w and update them
-        autowidgets_this = [
-            widget for widget in self.autowidgets if w in widget._autoinputs
-        ]
-        for widget in autowidgets_this:
+        wname = w.objectName()
+        varname = self.widget_to_var[wname]
+        newval = w.getVal()
+        # no actual change (e.g. reformatted text), nothing to update
+        if self.data[varname] == newval:
+            return
+        # update autowidgets that depend on w
+        for widget in self._autowidget_deps.get(w, ()):
             widget._autocalculate()
-        if self.update_dict:
-            # update internal data dict
-            wname = w.objectName()
-            varname = self.widget_to_var[wname]
-            newval = w.getVal()
-            self.data[varname] = newval
-            # perform the corresponding SQL update
-            self.update_rom([varname], [newval])
+        self._invalidate_units()
+        # update internal data dict
+        self._update_data(varname, newval)
+        # schedule the corresponding SQL update
+        self._dirty[varname] = newval
+        self._update_timer.start()
+
+    def _update_data(self, var, val):
+        """Update a variable in the data dict"""
+        self.data[var] = val
+        if val != self.data_empty[var]:
+            self._modified_keys.add(var)
+        else:
+            self._modified_keys.discard(var)
+
+    def _update_modified_keys(self):
+        """Recompute the set of modified variables from scratch"""
+        self._modified_keys = {
+            key for key, val in self.data.items() if val != self.data_empty[key]
+        }
 
     def keyerror_dialog(self, origkeys, newkeys):
         """Report missing / unknown keys to user."""
@@ -538,17 +596,23 @@ class EntryApp(QtWidgets.QMainWindow):
     @property
     def data_with_units(self):
         """Append units to values"""
-        return {key: f'{self.data[key]}{self.units[key]}' for key in self.data}
+        if self._data_with_units is None:
+            units = self.units
+            self._data_with_units = {
+                key: f'{val}{units[key]}' for key, val in self.data.items()
+            }
+        return self._data_with_units
 
     def _read_data(self):
         """Read input data from database"""
-        vars = list(self.data.keys())
+        vars = self._vars
         # get data as QVariants, and ignore NULL ones (which correspond to missing data in database)
         qvals = self.select(vars)
-        record_di = {
-            var: qval.value() for var, qval in zip(vars, qvals) if not qval.isNull()
-        }
-        self.data = self.data_empty | record_di
+        # reset to defaults and update with the database values, in place
+        self.data.update(self.data_empty)
+        self.data.update(
+            (var, qval.value()) for var, qval in zip(vars, qvals) if not qval.isNull()
+        )
         self.restore_forms()
 
     def _compose_json_filename(self):
@@ -567,39 +631,62 @@ class EntryApp(QtWidgets.QMainWindow):
         # ID data is not updated from widgets in the SQL version, so get it separately
         rdata = self.data | self.get_patient_id_data()
         with open(fn, 'w', encoding='utf-8') as f:
-            f.write(json.dumps(rdata, ensure_ascii=False, indent=True, sort_keys=True))
+            f.write(json.dumps(rdata, ensure_ascii=False, indent=2, sort_keys=True))
 
-    def make_txt_report(self, template, include_units=True):
-        """Create text report from current data"""
+    def _report(self, include_units=True):
+        """Create a Report instance from current data. The Report gets copies
+        of the data, so it's safe to use from a worker thread."""
         # uncomment to respond to template changes while running
         # importlib.reload(reporter)
         data = self.data_with_units if include_units else self.data
         # ID data is not updated from widgets in the SQL version, so get it separately
         rdata = data | self.get_patient_id_data()
-        rep = reporter.Report(rdata, self.vars_default)
-        return rep.make_report(template)
+        return reporter.Report(rdata, self.vars_default)
+
+    def make_txt_report(self, template, include_units=True):
+        """Create text report from current data"""
+        return self._report(include_units).make_report(template)
 
     def make_excel_report(self):
         """Create Excel report from current data"""
-        # ID data is not updated from widgets in the SQL version, so get it separately
-        rdata = self.data | self.get_patient_id_data()
-        rep = reporter.Report(rdata, self.vars_default)
-        return rep.make_excel(self.xls_template)
+        return self._report(include_units=False).make_excel(self.xls_template)
+
+    def _make_report_in_background(self, make_report, on_finished):
+        """Run report creation function make_report in a worker thread, then
+        call on_finished with the report. Report actions are disabled
+        meanwhile."""
+        report_actions = [
+            self.actionTekstiraportti,
+            self.actionTekstiraportti_isokineettinen,
+            self.actionExcel_raportti,
+        ]
+        run_with_disabled_actions(self._tasks, report_actions, make_report, on_finished)
 
     def _save_default_text_report_dialog(self):
         """Create text report and open dialog for saving it"""
-        txt = self.make_txt_report(self.text_template)
-        self._save_text_report_dialog(txt, Config.text_report_prefix)
+        rep, template = self._report(), self.text_template
+        self._make_report_in_background(
+            lambda: rep.make_report(template),
+            lambda txt: self._save_text_report_dialog(txt, Config.text_report_prefix),
+        )
 
     def _save_isokin_text_report_dialog(self):
         """Create isokinetic text report and open dialog for saving it"""
-        txt = self.make_txt_report(self.isokin_text_template, include_units=False)
-        self._save_text_report_dialog(txt, Config.isokin_text_report_prefix)
+        rep = self._report(include_units=False)
+        template = self.isokin_text_template
+        self._make_report_in_background(
+            lambda: rep.make_report(template),
+            lambda txt: self._save_text_report_dialog(
+                txt, Config.isokin_text_report_prefix
+            ),
+        )
 
     def _save_default_excel_report_dialog(self):
         """Create Excel report and open dialog for saving it"""
-        wb = self.make_excel_report()
-        self._save_excel_report_dialog(wb)
+        rep, template = self._report(include_units=False), self.xls_template
+        self._make_report_in_background(
+            lambda: rep.make_excel(template), self._save_excel_report_dialog
+        )
 
     def _save_text_report_dialog(self, report_txt, prefix):
         """Bring up save dialog and save text report"""
@@ -633,10 +720,11 @@ class EntryApp(QtWidgets.QMainWindow):
 
     def n_modified(self):
         """Count modified values."""
-        return len([x for x in self.data if self.data[x] != self.data_empty[x]])
+        return len(self._modified_keys)
 
     def page_change(self):
         """Callback for tab change"""
+        self._flush_updates()
         newpage = self.maintab.currentWidget()
         # focus / selectAll on 1st widget of new tab
         if newpage in self.firstwidget:
@@ -646,19 +734,31 @@ class EntryApp(QtWidgets.QMainWindow):
                 widget.setFocus()
 
     def restore_forms(self):
-        """Restore widget input values from self.data. Need to disable widget
-        callbacks and automatic data saving while programmatic updating of
-        widgets is taking place."""
-        self.save_to_tmp = False
-        self.update_dict = False
-        for wname in self.input_widgets:
-            self.input_widgets[wname].setVal(self.data[self.widget_to_var[wname]])
-        self.save_to_tmp = True
-        self.update_dict = True
+        """Restore widget input values from self.data.
+
+        Widget signals are blocked while programmatic updating of widgets is
+        taking place, so that no database updates are triggered. Hence the
+        autowidgets need to be updated explicitly.
+        """
+        blockers = [QtCore.QSignalBlocker(w) for w in self.input_widgets.values()]
+        try:
+            for w, var, _, setval in self._widget_ops:
+                setval(w, self.data[var])
+            for w in self.autowidgets:
+                w._autocalculate()
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+        self._invalidate_units()
+        self._update_modified_keys()
+
+    def _read_widgets(self):
+        """Return the widget input values as a dict"""
+        return {var: getval(w) for w, var, getval, _ in self._widget_ops}
 
     def read_forms(self):
         """Read self.data from widget inputs. Usually not needed, since
         it's updated automatically."""
-        for wname in self.input_widgets:
-            var = self.widget_to_var[wname]
-            self.data[var] = self.input_widgets[wname].getVal()
+        self.data.update(self._read_widgets())
+        self._invalidate_units()
+        self._update_modified_keys()
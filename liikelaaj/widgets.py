@@ -34,6 +34,117 @@ def message_dialog(msg):
     dlg.exec_()
 
 
+# Input widget types are indicated by the first 2-3 chars of the widget name:
+# spinbox or doublespinbox, lineedit, combobox, comment text field,
+# checkbox and CheckDegSpinBox
+WIDGET_PREFIXES = frozenset(('sp', 'ln', 'cb', 'cmt', 'xb', 'csb'))
+
+# matches the names of input widgets
+INPUT_WIDGET_RE = QtCore.QRegularExpression(
+    '^(%s)' % '|'.join(sorted(WIDGET_PREFIXES))
+)
+
+
+def widget_prefix(wname):
+    """Return the type prefix of an input widget name, or None if the name
+    does not indicate an input widget."""
+    for prefix in (wname[:3], wname[:2]):
+        if prefix in WIDGET_PREFIXES:
+            return prefix
+    return None
+
+
+def widget_varname(wname, prefix):
+    """Return the variable name for an input widget.
+
+    Variable names are derived by removing the type prefix from widget names
+    (except for comment box variables cmt* which are identical with widget
+    names).
+    """
+    return wname if prefix == 'cmt' else wname[len(prefix):]
+
+
+class _TaskSignals(QtCore.QObject):
+    """Signals for BackgroundTask"""
+
+    finished = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(object)
+
+
+class BackgroundTask(QtCore.QRunnable):
+    """Runs a function in a worker thread, when started by a QThreadPool.
+    The return value of the function is emitted by signals.finished, or
+    the exception raised by signals.failed. QRunnable is not a QObject,
+    so the signals live in a separate object.
+
+    Objects passed to the function should not be touched by the GUI thread
+    while the task is running; pass copies of mutable data instead.
+    """
+
+    def __init__(self, func):
+        super().__init__()
+        self.func = func
+        self.signals = _TaskSignals()
+        # the caller keeps a reference until the task is finished
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            result = self.func()
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
+def run_in_background(tasks, func, on_finished, on_failed=None, pool=None):
+    """Run func in a worker thread from pool (by default, the global thread
+    pool).
+
+    When finished, on_finished is called in the GUI thread with the return
+    value of func. Exceptions raised by func are passed to on_failed (if
+    given) and then re-raised in the GUI thread, so that they get caught by
+    the fatal exception mechanism. tasks is a set that keeps a reference to
+    the task while it is running.
+    """
+    task = BackgroundTask(func)
+    tasks.add(task)
+
+    def _finished(result):
+        tasks.discard(task)
+        on_finished(result)
+
+    def _failed(exc):
+        tasks.discard(task)
+        if on_failed is not None:
+            on_failed(exc)
+        raise exc
+
+    task.signals.finished.connect(_finished)
+    task.signals.failed.connect(_failed)
+    if pool is None:
+        pool = QtCore.QThreadPool.globalInstance()
+    pool.start(task)
+
+
+def run_with_disabled_actions(tasks, actions, func, on_finished):
+    """Run func in the background (see run_in_background), with the given
+    actions disabled until func has finished or failed."""
+
+    def _enable_actions(enabled=True):
+        for action in actions:
+            action.setEnabled(enabled)
+
+    def _finished(result):
+        _enable_actions()
+        on_finished(result)
+
+    _enable_actions(False)
+    run_in_background(
+        tasks, func, _finished, on_failed=lambda exc: _enable_actions()
+    )
+
+
 class MyLineEdit(QtWidgets.QLineEdit):
     """Custom line edit that selects the input on mouse click."""
 
@@ -76,6 +187,28 @@ class DegLineEdit(QtWidgets.QLineEdit):
             super().keyPressEvent(event)
 
 
+class EscResetSpinBox(QtWidgets.QSpinBox):
+    """Spinbox that is reset to its minimum value (the "not measured" state)
+    when Esc is pressed"""
+
+    def keyPressEvent(self, event):
+        if event.key() == QtCore.Qt.Key_Escape:
+            self.setValue(self.minimum())
+        else:
+            super().keyPressEvent(event)
+
+
+class EscResetDoubleSpinBox(QtWidgets.QDoubleSpinBox):
+    """Double spinbox that is reset to its minimum value when Esc is
+    pressed"""
+
+    def keyPressEvent(self, event):
+        if event.key() == QtCore.Qt.Key_Escape:
+            self.setValue(self.minimum())
+        else:
+            super().keyPressEvent(event)
+
+
 class CheckDegSpinBox(QtWidgets.QWidget):
     """Custom widget: Spinbox (degrees) with checkbox signaling
     "default value". If checkbox is checked, disable spinbox,
@@ -224,3 +357,146 @@ class CheckDegSpinBox(QtWidgets.QWidget):
     # not sure if useful
     # def sizeHint(self):
     #    return QSize(150,20)
+
+
+# Convenience methods for the input widgets. These are shared by the entry
+# apps, which bind them to the widgets (using MethodType).
+
+
+def _isint(x):
+    """Test for integer"""
+    try:
+        int(x)
+        return True
+    except ValueError:
+        return False
+
+
+def _no_unit(w):
+    """Unit for inputs that do not have one"""
+    return ''
+
+
+def _spinbox_getval(w):
+    """Return spinbox value"""
+    return w.no_value_text if w.value() == w.minimum() else w.value()
+
+
+def _spinbox_setval(w, val):
+    """Set spinbox value"""
+    val = w.minimum() if val == w.no_value_text else val
+    w.setValue(val)
+
+
+def _spinbox_unit(w):
+    """Return spinbox unit (suffix), or '' for special values"""
+    return w.suffix() if _isint(w.getVal()) else ''
+
+
+def _lineedit_getval(w):
+    """Return lineedit text"""
+    return w.text().strip()
+
+
+def _comment_getval(w):
+    """Return comment text"""
+    return w.toPlainText().strip()
+
+
+def init_checkbox_texts(w):
+    """Set the value texts of a checkbox, and the lookup tables used by the
+    checkbox getter and setter"""
+    w.yes_text = Config.checkbox_yestext
+    w.no_text = Config.checkbox_notext
+    w._state_to_text = {
+        QtCore.Qt.Unchecked: w.no_text,
+        QtCore.Qt.Checked: w.yes_text,
+    }
+    w._text_to_state = {
+        w.no_text: QtCore.Qt.Unchecked,
+        w.yes_text: QtCore.Qt.Checked,
+    }
+
+
+def _checkbox_getval(w):
+    """Return yestext or notext for checkbox enabled/disabled,
+    respectively."""
+    try:
+        return w._state_to_text[w.checkState()]
+    except KeyError:
+        raise RuntimeError(
+            f'Unexpected checkbox value: {int(w.checkState())} '
+            f'for {w.objectName()}'
+        )
+
+
+def _checkbox_setval(w, val):
+    """Set checkbox value to enabled for val == yestext and
+    disabled for val == notext"""
+    try:
+        w.setCheckState(w._text_to_state[val])
+    except KeyError:
+        raise RuntimeError(
+            f'Unexpected checkbox entry value: {val} for {w.objectName()}'
+        )
+
+
+def _combobox_setval(w, val):
+    """Set combobox value according to val (must be one of the combobox
+    items)"""
+    idx = w.findText(val)
+    if idx >= 0:
+        w.setCurrentIndex(idx)
+    else:
+        raise ValueError(f'Tried to set combobox to invalid value {val}')
+
+
+def _checkdegspinbox_unit(w):
+    """Return CheckDegSpinBox unit (suffix), or '' for special values"""
+    return w.getSuffix() if _isint(w.getVal()) else ''
+
+
+# Accessors for each input widget type: the name of the change signal, and
+# the functions for getting the value, setting the value and getting the unit
+WIDGET_ACCESSORS = {
+    'sp': ('valueChanged', _spinbox_getval, _spinbox_setval, _spinbox_unit),
+    'ln': (
+        'textChanged',
+        _lineedit_getval,
+        QtWidgets.QLineEdit.setText,
+        _no_unit,
+    ),
+    'cb': (
+        'currentIndexChanged',
+        QtWidgets.QComboBox.currentText,
+        _combobox_setval,
+        _no_unit,
+    ),
+    'cmt': (
+        'textChanged',
+        _comment_getval,
+        QtWidgets.QTextEdit.setPlainText,
+        _no_unit,
+    ),
+    'xb': ('stateChanged', _checkbox_getval, _checkbox_setval, _no_unit),
+    'csb': (
+        'valueChanged',
+        CheckDegSpinBox.value,
+        CheckDegSpinBox.setValue,
+        _checkdegspinbox_unit,
+    ),
+}
+
+
+def widget_ops(input_widgets, widget_to_var):
+    """Return (widget, varname, getter, setter) tuples for quick iteration
+    over the input widgets.
+
+    input_widgets maps widget names to widgets, and widget_to_var widget
+    names to variable names. The getters and setters are the per-type
+    functions of WIDGET_ACCESSORS, called as getter(w) and setter(w, val).
+    """
+    return tuple(
+        (w, widget_to_var[wname], *WIDGET_ACCESSORS[widget_prefix(wname)][1:3])
+        for wname, w in input_widgets.items()
+    )
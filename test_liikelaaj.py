@@ -7,16 +7,23 @@ unit tests for liikelaajuus
 """
 
 from pathlib import Path
+from io import BytesIO
+from functools import lru_cache
 import argparse
-import hashlib
 import json
 import sys
-from builtins import object, range, str
 
-from PyQt5 import QtWidgets, uic
+import pytest
 from xlrd import open_workbook
 
-from liikelaaj import liikelaajuus
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Qt and the apps are imported only by the tests that need them (see the
+# eapp fixture), so that the template tests can run without Qt; xlrd and the
+# reporter module are still needed by the template tests
 from liikelaaj.config import Config
 from liikelaaj.reporter import Report
 
@@ -25,7 +32,6 @@ pkg_path = Path('liikelaaj')
 xls_template = pkg_path / Config.xls_template
 text_template = pkg_path / Config.text_template
 isokin_text_template = pkg_path / Config.isokin_text_template
-uifile = pkg_path / 'tabbed_design.ui'
 
 # empty data
 fn_emptyvals = testdata / 'empty.json'
@@ -38,31 +44,190 @@ fn_isokin_txt_ref = testdata / 'isokin_anonyymi.txt'
 fn_xls_ref = testdata / 'anonyymi.xls'
 
 # temporary files written out by tests below
-fn_xls_out = testdata / 'tests_xls_report_out.xls'
 fn_out = testdata / 'tests_data_out.json'
 
-with open(fn_emptyvals, 'r', encoding='utf-8') as f:
-    data_emptyvals = json.load(f)
 
-app = QtWidgets.QApplication(sys.argv)  # needed for Qt stuff to function
+def load_json(fn):
+    """ Parse a JSON file. Uses orjson if available, like the app. """
+    buf = fn.read_bytes()
+    return orjson.loads(buf) if orjson is not None else json.loads(buf)
+
+
+data_emptyvals = load_json(fn_emptyvals)
+# all valid variable names
+valid_vars = frozenset(data_emptyvals)
+# variables that are not referenced by the text report template
+text_template_unused = frozenset([
+    'AntropJalkateraOik',
+    'AntropJalkateraVas',
+    'AntropKenganPituusOik',
+    'AntropKenganPituusVas',
+    'AntropPolviTuetOik',
+    'AntropPolviTuetVas',
+    'AntropNilkkaTuetOik',
+    'AntropNilkkaTuetVas',
+    'EMGGas',
+    'EMGGlut',
+    'EMGHam',
+    'EMGPer',
+    'EMGRec',
+    'EMGSol',
+    'EMGTibA',
+    'EMGVas',
+    'FMSKoulussa',
+    'FMSLyhyetMatkat',
+    'FMSPitkatMatkat',
+    'IsokinNilkkaDorsifleksioMomenttiOikNorm',
+    'IsokinNilkkaDorsifleksioMomenttiOikNormUn',
+    'IsokinNilkkaDorsifleksioMomenttiVasNorm',
+    'IsokinNilkkaDorsifleksioMomenttiVasNormUn',
+    'IsokinNilkkaDorsifleksioOik',
+    'IsokinNilkkaDorsifleksioVas',
+    'IsokinNilkkaLiikenopeusDorsifleksioOik',
+    'IsokinNilkkaLiikenopeusDorsifleksioVas',
+    'IsokinNilkkaLiikenopeusPlantaarifleksioOik',
+    'IsokinNilkkaLiikenopeusPlantaarifleksioVas',
+    'IsokinNilkkaPlantaarifleksioMomenttiOikNorm',
+    'IsokinNilkkaPlantaarifleksioMomenttiOikNormUn',
+    'IsokinNilkkaPlantaarifleksioMomenttiVasNorm',
+    'IsokinNilkkaPlantaarifleksioMomenttiVasNormUn',
+    'IsokinNilkkaPlantaarifleksioOik',
+    'IsokinNilkkaPlantaarifleksioVas',
+    'IsokinPolviEkstensioMomenttiOikNorm',
+    'IsokinPolviEkstensioMomenttiOikNormUn',
+    'IsokinPolviEkstensioMomenttiVasNorm',
+    'IsokinPolviEkstensioMomenttiVasNormUn',
+    'IsokinPolviEkstensioOik',
+    'IsokinPolviEkstensioVas',
+    'IsokinPolviFleksioMomenttiOikNorm',
+    'IsokinPolviFleksioMomenttiOikNormUn',
+    'IsokinPolviFleksioMomenttiVasNorm',
+    'IsokinPolviFleksioMomenttiVasNormUn',
+    'IsokinPolviFleksioOik',
+    'IsokinPolviFleksioVas',
+    'IsokinPolviLiikenopeusEkstensioOik',
+    'IsokinPolviLiikenopeusEkstensioVas',
+    'IsokinPolviLiikenopeusFleksioOik',
+    'IsokinPolviLiikenopeusFleksioVas',
+    'KyselyApuvKaytossa',
+    'KyselyApuvMuutokset',
+    'KyselyApuvRajoittavat',
+    'KyselyFAQAskellanTuettuna',
+    'KyselyFAQEiAskeleita',
+    'KyselyFAQKOmmentit',
+    'KyselyFAQKavelenJonkinVerranSisalla',
+    'KyselyFAQKavelenLyhyitaMatkojaKotona',
+    'KyselyFAQKavelenPitempiaMatkojaUlkonaEpatasaisellaApua',
+    'KyselyFAQKavelenPitempiaMatkojaUlkonaTasaisella',
+    'KyselyFAQKavelenTerapiassa',
+    'KyselyFAQKavelenUlkonaEpatasaisellaPientaApua',
+    'KyselyFAQKavelenUlkonaKaikissaMaastoissa',
+    'KyselyKavelenJonkinVerranUlkona',
+    'KyselyKipuKuvaus',
+    'KyselyKipujaViim6kk',
+    'KyselyPaivittainenMatka',
+    'KyselyPaivittainenYhtajaksMatkaApuv',
+    'KyselyPaivittainenYhtajaksMatkaIlmanApuv',
+    'cmtIsokin',
+    'cmtKysely',
+])
+# the reference data is read once and shared by the tests
+data_ref = load_json(fn_ref)
+
+
+@pytest.fixture(scope='module')
+def eapp():
+    """ Create instance of app that is not shown on screen (also event loop is
+    not entered) but can be used to test various methods. The instance is
+    shared by the tests. NOTE: any existing temp file may be deleted by the
+    unit tests """
+    QtWidgets = pytest.importorskip('PyQt5.QtWidgets')
+    from liikelaaj import liikelaajuus
+    # needed for Qt stuff to function
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    eapp = liikelaajuus.EntryApp(check_temp_file=False)
+    yield eapp
+    # the QApplication is kept alive until the module's tests are done
+    del eapp, app
+
+
+@pytest.fixture
+def sql_eapp(monkeypatch):
+    """ Create an instance of the SQL version of the app, using an in-memory
+    SQLite database with a single ROM. Yields the app and the database. """
+    QtWidgets = pytest.importorskip('PyQt5.QtWidgets')
+    QtSql = pytest.importorskip('PyQt5.QtSql')
+    from liikelaaj import sql_entryapp
+    # database errors are shown in a dialog
+    monkeypatch.setattr(sql_entryapp, 'message_dialog', lambda msg: None)
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    db = QtSql.QSqlDatabase.addDatabase('QSQLITE', 'test_liikelaaj')
+    db.setDatabaseName(':memory:')
+    assert db.open()
+    q = QtSql.QSqlQuery(db)
+    assert q.exec('CREATE TABLE patients (patient_id INTEGER PRIMARY KEY, '
+                  'firstname TEXT, lastname TEXT, ssn TEXT, '
+                  'patient_code TEXT, diagnosis TEXT)')
+    cols = ','.join('%s NUMERIC' % var for var in sorted(valid_vars))
+    assert q.exec('CREATE TABLE roms (rom_id INTEGER PRIMARY KEY, '
+                  'patient_id INTEGER, %s)' % cols)
+    assert q.exec("INSERT INTO patients VALUES "
+                  "(1, 'Etu', 'Suku', '010101-0101', 'C123', 'CP')")
+    assert q.exec("INSERT INTO roms (rom_id, patient_id, AntropPaino, "
+                  "KyselyFAQEiAskeleita, TiedotPvm) "
+                  "VALUES (1, 1, 40, '%s', '01.01.2020')"
+                  % Config.checkbox_notext)
+    q.finish()
+    eapp = sql_entryapp.EntryApp(db, 1)
+    yield eapp, db
+    eapp.force_close()
+    del eapp, q, app
+    db.close()
 
-""" Create instance of app that is not shown on screen (also event loop is not
-entered) but can be used to test various methods. NOTE: any existing temp file
-may be deleted by the unit tests """
-eapp = liikelaajuus.EntryApp(check_temp_file=False)
 
 # helper functions
 
 
-def file_md5(fn):
-    """ Get MD5 sum of file in a dumb way. Works for small files. """
-    return hashlib.md5(open(fn, 'rb').read()).hexdigest()
+def db_values(db, vars):
+    """ Read the values of given variables of ROM 1 from the database """
+    from PyQt5 import QtSql
+    q = QtSql.QSqlQuery(db)
+    assert q.exec('SELECT %s FROM roms WHERE rom_id = 1' % ','.join(vars))
+    assert q.first()
+    values = tuple(q.value(k) for k in range(len(vars)))
+    q.finish()
+    return values
+
+
+@lru_cache(maxsize=None)
+def get_fields(s):
+    """ Cached Report._get_fields(); returns the fields as a tuple, since many
+    template strings repeat. """
+    return tuple(Report._get_fields(s))
+
+
+def xls_sheet_values(wb):
+    """ Return cell values of the first sheet of a workbook as a list of
+    rows. Only the values are compared, since the exact bytes written by
+    xlwt may change between versions. """
+    sheet = wb.sheet_by_index(0)
+    return [sheet.row_values(row) for row in range(sheet.nrows)]
+
+
+def restore_ref_data(eapp):
+    """ Put the reference data into the app, like load_file() does but
+    without reading the file again. """
+    eapp.data.update(eapp.data_empty)
+    eapp.data.update(data_ref)
+    eapp.restore_forms()
 
 
 def regen_ref_data():
     """ Create new reference reports from reference data. Overwrites previous
     ref reports without asking. Only run when reporting is known to be correct.
     """
+    from PyQt5 import QtWidgets
+    from liikelaaj import liikelaajuus
     app = QtWidgets.QApplication(sys.argv)  # needed for Qt stuff to function
     eapp = liikelaajuus.EntryApp(check_temp_file=False)
     eapp.load_file(fn_ref)
@@ -77,69 +242,204 @@ def regen_ref_data():
 """ BEGIN TESTS """
 
 
-def test_save():
+def test_save(eapp):
     """Test load/save cycle"""
     eapp.load_file(fn_ref)
     eapp.save_file(fn_out)
-    with open(fn_ref, 'r', encoding='utf-8') as f:
-        data_ref = json.load(f)
-    with open(fn_out, 'r', encoding='utf-8') as f:
-        data_out = json.load(f)
+    data_out = load_json(fn_out)
     assert data_ref == data_out
 
 
-def test_text_report():
+def test_load_temp(eapp, tmp_path, monkeypatch):
+    """ Test restoring data from the temp file. The restored data must not
+    be considered saved. """
+    tmpfile = tmp_path / 'liikelaajuus_tmp.json'
+    tmpfile.write_bytes(fn_ref.read_bytes())
+    monkeypatch.setattr(Config, 'tmpfile_path', tmpfile)
+    eapp.saved_to_file = True
+    eapp.load_temp()
+    assert eapp.data == data_ref
+    assert not eapp.saved_to_file
+
+
+def test_write_json_failure(tmp_path):
+    """ Test that a failed JSON write leaves the target file untouched and
+    removes the temporary file """
+    pytest.importorskip('PyQt5.QtCore')
+    from liikelaaj import liikelaajuus
+    target = tmp_path / 'data.json'
+    target.write_bytes(fn_ref.read_bytes())
+    # the data cannot be serialized
+    with pytest.raises(TypeError):
+        liikelaajuus._write_json(target, {'foo': object()})
+    assert target.read_bytes() == fn_ref.read_bytes()
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def wait_for_tasks(pool=None):
+    """ Wait for the background tasks in given thread pool (default the
+    global pool) and deliver their finished/failed signals. """
+    from PyQt5 import QtCore, QtWidgets
+    if pool is None:
+        pool = QtCore.QThreadPool.globalInstance()
+    pool.waitForDone()
+    QtWidgets.QApplication.processEvents()
+
+
+def test_save_temp(eapp, tmp_path, monkeypatch):
+    """ Test the delayed temp file save, which is written in the IO thread """
+    tmpfile = tmp_path / 'liikelaajuus_tmp.json'
+    monkeypatch.setattr(Config, 'tmpfile_path', tmpfile)
+    eapp.lnTiedotNimi.setVal('Testi Potilas')
+    assert eapp.data['TiedotNimi'] == 'Testi Potilas'
+    # the save is delayed
+    assert eapp._save_timer.isActive()
+    assert not tmpfile.exists()
+    eapp._flush_temp()
+    wait_for_tasks(eapp._io_pool)
+    assert load_json(tmpfile) == eapp.data
+    assert not eapp._tasks
+    # no leftovers from the atomic write
+    assert list(tmp_path.iterdir()) == [tmpfile]
+
+
+def test_report_actions(eapp, monkeypatch):
+    """ Test that the report actions are disabled while a report is being
+    created in the background, and enabled again when it finishes or
+    fails """
+    actions = (eapp.actionTekstiraportti,
+               eapp.actionTekstiraportti_isokineettinen,
+               eapp.actionExcel_raportti)
+    results = list()
+    eapp._make_report_in_background(lambda: 'report', results.append)
+    assert not any(action.isEnabled() for action in actions)
+    wait_for_tasks()
+    assert results == ['report']
+    assert all(action.isEnabled() for action in actions)
+    # exceptions are re-raised in the GUI thread; catch them here
+    errors = list()
+    monkeypatch.setattr(sys, 'excepthook',
+                        lambda type, value, tback: errors.append(value))
+    exc = ValueError('broken template')
+
+    def _fail():
+        raise exc
+
+    eapp._make_report_in_background(_fail, results.append)
+    assert not any(action.isEnabled() for action in actions)
+    wait_for_tasks()
+    assert errors == [exc]
+    assert results == ['report']
+    assert all(action.isEnabled() for action in actions)
+    assert not eapp._tasks
+
+
+def test_sql_delayed_updates(sql_eapp):
+    """ Test the delayed database updates of the SQL app. Changed values are
+    written in a single transaction when the update timer fires (or the app
+    is closed). """
+    eapp, db = sql_eapp
+    vars = ('AntropPaino', 'KyselyFAQEiAskeleita', 'TiedotPvm')
+    assert eapp.data['AntropPaino'] == 40
+    eapp.spAntropPaino.setVal(50)
+    eapp.xbKyselyFAQEiAskeleita.setVal(Config.checkbox_yestext)
+    # line edits are updated when they lose focus
+    eapp.lnTiedotPvm.setVal('02.02.2020')
+    eapp.values_changed(eapp.lnTiedotPvm)
+    # nothing is written before the flush
+    assert eapp._update_timer.isActive()
+    assert db_values(db, vars) == (40, Config.checkbox_notext, '01.01.2020')
+    eapp._flush_updates()
+    new_values = (50, Config.checkbox_yestext, '02.02.2020')
+    assert db_values(db, vars) == new_values
+    assert not eapp._dirty
+    # on failure, the transaction is rolled back and the values are kept
+    # for the next update
+    from PyQt5 import QtSql
+    q = QtSql.QSqlQuery(db)
+    assert q.exec('ALTER TABLE roms RENAME TO roms_old')
+    eapp.spAntropPaino.setVal(60)
+    eapp._flush_updates()
+    assert eapp._dirty == {'AntropPaino': 60}
+    # a new transaction can be started only if the failed one was ended
+    assert db.transaction()
+    assert db.rollback()
+    assert q.exec('ALTER TABLE roms_old RENAME TO roms')
+    q.finish()
+    assert db_values(db, vars) == new_values
+    # pending values are written on close
+    eapp.close()
+    assert not eapp._dirty
+    assert db_values(db, vars) == (60,) + new_values[1:]
+
+
+def test_lock_instance(tmp_path, monkeypatch):
+    """ Test the lock file that prevents running multiple instances """
+    pytest.importorskip('PyQt5.QtCore')
+    from liikelaaj import liikelaajuus
+    monkeypatch.setattr(Config, 'lockfile_path', tmp_path / 'test.lock')
+    lock = liikelaajuus._lock_instance()
+    assert lock is not None and lock.isLocked()
+    # another instance cannot get the lock
+    assert liikelaajuus._lock_instance() is None
+    lock.unlock()
+    assert liikelaajuus._lock_instance() is not None
+    # failure to create the lock file does not mean that another instance
+    # is running
+    monkeypatch.setattr(Config, 'lockfile_path',
+                        tmp_path / 'nonexistent' / 'test.lock')
+    lock = liikelaajuus._lock_instance()
+    assert lock is not None and not lock.isLocked()
+
+
+def test_text_report(eapp):
     """ Use app to load reference data and generate text report, compare
     with ref report """
     with open(fn_txt_ref, 'r', encoding='utf-8') as f:
         report_ref = f.read()
-    eapp.load_file(fn_ref)
+    restore_ref_data(eapp)
     report_txt = eapp.make_txt_report(text_template)
     assert report_ref == report_txt
 
 
-def test_isokin_text_report():
+def test_isokin_text_report(eapp):
     """ Use app to load reference data and generate text report, compare
     with ref report """
     with open(fn_isokin_txt_ref, 'r', encoding='utf-8') as f:
         report_ref = f.read()
-    eapp.load_file(fn_ref)
+    restore_ref_data(eapp)
     report_txt = eapp.make_txt_report(isokin_text_template, include_units=False)
     assert report_ref == report_txt
 
 
-def test_xls_report():
+def test_xls_report(eapp):
     """ Use app to load reference data and generate xls report, compare
     with ref report """
-    eapp.load_file(fn_ref)
+    restore_ref_data(eapp)
     report = Report(eapp.data_with_units, eapp.vars_default)
     wb = report.make_excel(xls_template)
-    wb.save(fn_xls_out)
-    wb_out = open_workbook(fn_xls_out, formatting_info=True)
-    wb_ref = open_workbook(fn_xls_ref, formatting_info=True)
-    sheet = wb_out.sheet_by_index(0)
-    sheet_ref = wb_ref.sheet_by_index(0)
-    for row in range(sheet.nrows):
-        for col in range(sheet.ncols):
-            cell = sheet.cell(row, col)
-            cell_ref = sheet_ref.cell(row, col)
-            assert cell.value == cell_ref.value
+    # round-trip the workbook in memory, without a temporary file
+    buf = BytesIO()
+    wb.save(buf)
+    wb_out = open_workbook(file_contents=buf.getvalue(), on_demand=True)
+    wb_ref = open_workbook(fn_xls_ref, on_demand=True)
+    assert xls_sheet_values(wb_out) == xls_sheet_values(wb_ref)
 
 
 def test_xls_template():
     """ Test validity of xls report template: no unknown vars
     in template """
-    rb = open_workbook(xls_template, formatting_info=True)
+    # only the cell values are needed, so skip the formatting info
+    rb = open_workbook(xls_template, formatting_info=False, on_demand=True)
     r_sheet = rb.sheet_by_index(0)
+    # extract all fields (variable names) in the cells
+    fields = set()
     for row in range(r_sheet.nrows):
-        for col in range(r_sheet.ncols):
-            cl = r_sheet.cell(row, col)
-            celltext = cl.value
+        for celltext in r_sheet.row_values(row):
             if celltext:
-                # extract all fields (variable names) in the cell
-                flds = Report._get_fields(celltext)
-                for fld in flds:
-                    assert fld in data_emptyvals
+                fields.update(get_fields(celltext))
+    # report the unknown fields, if any
+    assert not fields - valid_vars
 
 
 class FakeReport(object):
@@ -163,121 +463,48 @@ def test_text_template():
     no unknown vars in report """
     fields = set()
     report = FakeReport()
-    checkbox_yes = liikelaajuus.Config.checkbox_yestext
+    checkbox_yes = Config.checkbox_yestext
     ldict = locals()
     exec(compile(open(text_template, "rb").read(), text_template, 'exec'),
          ldict, ldict)
     for li in report.text.split('\n'):
-        fields.update(set(Report._get_fields(li)))
-    # the report does not currently reference following flds
-    exclude_ = ['AntropJalkateraOik',
-                'AntropJalkateraVas',
-                'AntropKenganPituusOik',
-                'AntropKenganPituusVas',
-                'AntropPolviTuetOik',
-                'AntropPolviTuetVas',
-                'AntropNilkkaTuetOik',
-                'AntropNilkkaTuetVas',
-                'EMGGas',
-                'EMGGlut',
-                'EMGHam',
-                'EMGPer',
-                'EMGRec',
-                'EMGSol',
-                'EMGTibA',
-                'EMGVas',
-                'FMSKoulussa',
-                'FMSLyhyetMatkat',
-                'FMSPitkatMatkat',
-                'IsokinNilkkaDorsifleksioMomenttiOikNorm',
-                'IsokinNilkkaDorsifleksioMomenttiOikNormUn',
-                'IsokinNilkkaDorsifleksioMomenttiVasNorm',
-                'IsokinNilkkaDorsifleksioMomenttiVasNormUn',
-                'IsokinNilkkaDorsifleksioOik',
-                'IsokinNilkkaDorsifleksioVas',
-                'IsokinNilkkaLiikenopeusDorsifleksioOik',
-                'IsokinNilkkaLiikenopeusDorsifleksioVas',
-                'IsokinNilkkaLiikenopeusPlantaarifleksioOik',
-                'IsokinNilkkaLiikenopeusPlantaarifleksioVas',
-                'IsokinNilkkaPlantaarifleksioMomenttiOikNorm',
-                'IsokinNilkkaPlantaarifleksioMomenttiOikNormUn',
-                'IsokinNilkkaPlantaarifleksioMomenttiVasNorm',
-                'IsokinNilkkaPlantaarifleksioMomenttiVasNormUn',
-                'IsokinNilkkaPlantaarifleksioOik',
-                'IsokinNilkkaPlantaarifleksioVas',
-                'IsokinPolviEkstensioMomenttiOikNorm',
-                'IsokinPolviEkstensioMomenttiOikNormUn',
-                'IsokinPolviEkstensioMomenttiVasNorm',
-                'IsokinPolviEkstensioMomenttiVasNormUn',
-                'IsokinPolviEkstensioOik',
-                'IsokinPolviEkstensioVas',
-                'IsokinPolviFleksioMomenttiOikNorm',
-                'IsokinPolviFleksioMomenttiOikNormUn',
-                'IsokinPolviFleksioMomenttiVasNorm',
-                'IsokinPolviFleksioMomenttiVasNormUn',
-                'IsokinPolviFleksioOik',
-                'IsokinPolviFleksioVas',
-                'IsokinPolviLiikenopeusEkstensioOik',
-                'IsokinPolviLiikenopeusEkstensioVas',
-                'IsokinPolviLiikenopeusFleksioOik',
-                'IsokinPolviLiikenopeusFleksioVas',
-                'KyselyApuvKaytossa',
-                'KyselyApuvMuutokset',
-                'KyselyApuvRajoittavat',
-                'KyselyFAQAskellanTuettuna',
-                'KyselyFAQEiAskeleita',
-                'KyselyFAQKOmmentit',
-                'KyselyFAQKavelenJonkinVerranSisalla',
-                'KyselyFAQKavelenLyhyitaMatkojaKotona',
-                'KyselyFAQKavelenPitempiaMatkojaUlkonaEpatasaisellaApua',
-                'KyselyFAQKavelenPitempiaMatkojaUlkonaTasaisella',
-                'KyselyFAQKavelenTerapiassa',
-                'KyselyFAQKavelenUlkonaEpatasaisellaPientaApua',
-                'KyselyFAQKavelenUlkonaKaikissaMaastoissa',
-                'KyselyKavelenJonkinVerranUlkona',
-                'KyselyKipuKuvaus',
-                'KyselyKipujaViim6kk',
-                'KyselyPaivittainenMatka',
-                'KyselyPaivittainenYhtajaksMatkaApuv',
-                'KyselyPaivittainenYhtajaksMatkaIlmanApuv',
-                'cmtIsokin',
-                'cmtKysely']
-    all_fields = {fld for fld in data_emptyvals if fld not in exclude_}
-    assert fields == all_fields
-
-
-def test_widgets():
+        fields.update(get_fields(li))
+    assert fields == valid_vars - text_template_unused
+
+
+def test_widgets(eapp):
     """ Check classes of Qt widgets. Check that variable names derived
     from the widgets match the empty json file. """
-    # cannot refer to Qt widgets without creating a QApplication
-    mainui = uic.loadUi(uifile)
-    widgets = mainui.findChildren(QtWidgets.QWidget)
-    varnames = set()
+    from PyQt5 import QtCore, QtWidgets
+    from liikelaaj.widgets import (CheckDegSpinBox, EscResetSpinBox,
+                                   EscResetDoubleSpinBox)
+    # input widget name prefixes and the allowed widget classes; the 3-letter
+    # prefixes need to be checked first
+    widget_classes = (
+        ('csb', (CheckDegSpinBox,)),
+        ('cmt', (QtWidgets.QTextEdit,)),
+        ('sp', (EscResetSpinBox, EscResetDoubleSpinBox)),
+        ('ln', (QtWidgets.QLineEdit,)),
+        ('cb', (QtWidgets.QComboBox,)),
+        ('xb', (QtWidgets.QCheckBox,)),
+    )
+    # matches the names of the input widgets
+    input_widget_re = QtCore.QRegularExpression(
+        '^(%s)' % '|'.join(prefix for prefix, _ in widget_classes))
+    # use the widgets of the shared app instance, instead of loading the UI
+    # file again; let Qt filter the widgets by name
+    widgets = eapp.findChildren(QtWidgets.QWidget, input_widget_re)
+    varnames = list()
     for w in widgets:
         wname = w.objectName()
-        varname = ''
-        if wname[:2] == 'sp':
-            assert(w.__class__ == QtWidgets.QSpinBox or
-                   w.__class__ == QtWidgets.QDoubleSpinBox)
-            varname = wname[2:]
-        elif wname[:2] == 'ln':
-            assert(w.__class__ == QtWidgets.QLineEdit)
-            varname = wname[2:]
-        elif wname[:2] == 'cb':
-            assert(w.__class__ == QtWidgets.QComboBox)
-            varname = wname[2:]
-        elif wname[:3] == 'cmt':
-            assert(w.__class__ == QtWidgets.QTextEdit)
-            varname = wname
-        elif wname[:2] == 'xb':
-            assert(w.__class__ == QtWidgets.QCheckBox)
-            varname = wname[2:]
-        elif wname[:3] == 'csb':
-            assert(w.__class__ == liikelaajuus.CheckDegSpinBox)
-            varname = wname[3:]
-        if varname:
-            varnames.add(str(varname))
-    assert varnames == set(data_emptyvals.keys())
+        for prefix, classes in widget_classes:
+            if wname.startswith(prefix):
+                assert w.__class__ in classes
+                # comment fields keep the prefix in the variable name
+                varname = wname if prefix == 'cmt' else wname[len(prefix):]
+                varnames.append(varname)
+                break
+    assert frozenset(varnames) == valid_vars
 
 
 if __name__ == '__main__':